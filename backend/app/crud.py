@@ -1,5 +1,7 @@
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from datetime import datetime
 from app import models, schemas
 from app.auth import hash_password, verify_password
 
@@ -32,8 +34,12 @@ def create_task(db: Session, task: schemas.TaskCreate, user_id: int) -> models.T
     db.refresh(db_task)
     return db_task
 
-def get_tasks(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[models.Task]:
-    return db.query(models.Task).filter(models.Task.owner_id == user_id).offset(skip).limit(limit).all()
+def get_tasks(db: Session, user_id: int, skip: int = 0, limit: int = 100, after_id: Optional[int] = None) -> List[models.Task]:
+    query = db.query(models.Task).filter(models.Task.owner_id == user_id)
+    # Keyset pagination: unlike an offset, rows deleted from earlier pages cannot shift it
+    if after_id is not None:
+        query = query.filter(models.Task.id > after_id)
+    return query.order_by(models.Task.id).offset(skip).limit(limit).all()
 
 def get_task(db: Session, task_id: int, user_id: int) -> Optional[models.Task]:
     return db.query(models.Task).filter(models.Task.id == task_id, models.Task.owner_id == user_id).first()
@@ -55,4 +61,30 @@ def delete_task(db: Session, task_id: int, user_id: int) -> bool:
         return False
     db.delete(db_task)
     db.commit()
-    return True
\ No newline at end of file
+    return True
+
+def revoke_token(db: Session, jti: str, expires_at: datetime) -> bool:
+    # Rely on the unique constraint rather than a prior lookup so that of two
+    # concurrent revocations of the same jti exactly one wins
+    db.add(models.RevokedToken(jti=jti, expires_at=expires_at))
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return False
+    return True
+
+def is_token_revoked(db: Session, jti: str) -> bool:
+    return db.query(models.RevokedToken.id).filter(models.RevokedToken.jti == jti).first() is not None
+
+def get_revoked_jtis(db: Session, since: Optional[datetime] = None) -> List[str]:
+    query = db.query(models.RevokedToken.jti).filter(models.RevokedToken.expires_at > datetime.utcnow())
+    if since is not None:
+        query = query.filter(models.RevokedToken.revoked_at >= since)
+    return [jti for (jti,) in query]
+
+def prune_revoked_tokens(db: Session) -> int:
+    # Expired tokens are rejected by signature validation, so their revocation entries can go
+    deleted = db.query(models.RevokedToken).filter(models.RevokedToken.expires_at <= datetime.utcnow()).delete(synchronize_session=False)
+    db.commit()
+    return deleted
\ No newline at end of file
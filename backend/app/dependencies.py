@@ -4,6 +4,7 @@ from jose import JWTError
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.jwt_handler import decode_access_token
+from app.revocation import revocation_list
 from app import models, crud
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
@@ -17,10 +18,13 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
     try:
         payload = decode_access_token(token)
         user_id: str = payload.get("sub")
-        if user_id is None:
+        jti: str = payload.get("jti")
+        if user_id is None or jti is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
+    if revocation_list.is_revoked(db, jti):
+        raise credentials_exception
     user = crud.get_user_by_id(db, user_id=int(user_id))
     if user is None:
         raise credentials_exception
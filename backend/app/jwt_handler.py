@@ -1,33 +1,56 @@
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
 import os
+import uuid
 from dotenv import load_dotenv
 
 load_dotenv()
 
 SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
 
-def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+
+def _create_token(data: dict, token_type: str, expires_delta: timedelta) -> str:
     to_encode = data.copy()
-    
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode.update({"exp": expire})
-    
+    expire = datetime.utcnow() + expires_delta
+
+    # Every token carries a unique id so it can be revoked individually
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex, "type": token_type})
+
     if "sub" in to_encode:
         to_encode["sub"] = str(to_encode["sub"])
-    
+
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def _decode_token(token: str, token_type: str) -> dict:
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    if payload.get("type") != token_type:
+        raise JWTError("Invalid token type")
+    return payload
+
+def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    return _create_token(data, ACCESS_TOKEN_TYPE, expires_delta)
+
+def create_refresh_token(data: dict, expires_delta: timedelta = None) -> str:
+    if expires_delta is None:
+        expires_delta = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    return _create_token(data, REFRESH_TOKEN_TYPE, expires_delta)
+
 def decode_access_token(token: str) -> dict:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        return _decode_token(token, ACCESS_TOKEN_TYPE)
+    except JWTError as e:
+        raise e
+
+def decode_refresh_token(token: str) -> dict:
+    try:
+        return _decode_token(token, REFRESH_TOKEN_TYPE)
     except JWTError as e:
-        raise e
\ No newline at end of file
+        raise e
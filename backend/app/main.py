@@ -1,16 +1,31 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app import models
-from app.database import engine
-from app.routes import auth, tasks
+from app import models, profiling
+from app.database import engine, SessionLocal
+from app.revocation import revocation_list
+from app.routes import auth, tasks, internal
 import uvicorn
 
 models.Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Task Management System", description="A secure task management API with JWT authentication", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the revocation filter before serving so requests never wait on it
+    revocation_list.start(SessionLocal)
+    yield
+    revocation_list.stop()
+
+app = FastAPI(title="Task Management System", description="A secure task management API with JWT authentication", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(CORSMiddleware, allow_origins=["http://localhost:3000"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
 
+# Opt-in diagnostics; see app/profiling.py for the environment variables
+if profiling.PROFILING_ENABLED:
+    app.add_middleware(profiling.ProfilingMiddleware)
+if profiling.SLOW_QUERY_LOG_ENABLED:
+    profiling.install_slow_query_log(engine)
+
 @app.get("/", tags=["Health"])
 def read_root():
     return {"status": "healthy", "message": "Task Management API is running"}
@@ -18,6 +33,7 @@ def read_root():
 # Include routers
 app.include_router(auth.router)
 app.include_router(tasks.router)
+app.include_router(internal.router)
 
 if __name__ == "__main__":
   
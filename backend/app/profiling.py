@@ -0,0 +1,274 @@
+import cProfile
+import functools
+import hmac
+import inspect
+import itertools
+import logging
+import marshal
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import List, Optional
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_HISTORY = int(os.getenv("PROFILE_HISTORY", "50"))
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "0"))
+SLOW_QUERY_HISTORY = int(os.getenv("SLOW_QUERY_HISTORY", "200"))
+
+# Nothing below is installed unless one of these is configured, so a
+# deployment without them pays no per-request or per-query cost. Profiles can
+# only be read through the admin endpoints, so sampling needs the token too.
+PROFILING_ENABLED = bool(ADMIN_TOKEN)
+if PROFILE_SAMPLE_RATE > 0 and not ADMIN_TOKEN:
+    logger.warning("PROFILE_SAMPLE_RATE is ignored because ADMIN_TOKEN is not set")
+SLOW_QUERY_LOG_ENABLED = SLOW_QUERY_MS > 0
+
+PROFILE_TOP_FUNCTIONS = 30
+
+# Before 3.12 cProfile hooks only the thread that enabled it, so sync endpoints
+# in the thread pool need their own profiler. From 3.12 it is built on
+# sys.monitoring, which sees every thread and allows only one active profiler.
+PER_THREAD_PROFILING = sys.version_info < (3, 12)
+
+profiles: deque = deque(maxlen=PROFILE_HISTORY)
+slow_queries: deque = deque(maxlen=SLOW_QUERY_HISTORY)
+_profile_ids = itertools.count(1)
+_slow_query_ids = itertools.count(1)
+
+def is_admin_token(token: Optional[str]) -> bool:
+    return bool(ADMIN_TOKEN) and token is not None and hmac.compare_digest(token, ADMIN_TOKEN)
+
+class ProfileSession:
+    """Collects the per-thread profiles recorded while serving one request."""
+
+    def __init__(self):
+        self._profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def add(self, profile: cProfile.Profile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+
+    def stats(self) -> pstats.Stats:
+        stats = pstats.Stats(self._profiles[0])
+        for profile in self._profiles[1:]:
+            stats.add(profile)
+        return stats
+
+def _start_profile() -> Optional[cProfile.Profile]:
+    # Profiling must never fail the request it is attached to
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError as e:
+        logger.warning("Request not profiled: %s", e)
+        return None
+    return profile
+
+_active_session: ContextVar[Optional[ProfileSession]] = ContextVar("profile_session", default=None)
+
+def _record_profile(session: ProfileSession, method: str, path: str, status_code: Optional[int], duration: float) -> dict:
+    stats = session.stats()
+    top = []
+    for (filename, line, function), (_, ncalls, tottime, cumtime, _) in sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:PROFILE_TOP_FUNCTIONS]:
+        top.append({"function": f"{filename}:{line}({function})", "calls": ncalls, "total_time": tottime, "cumulative_time": cumtime})
+    record = {
+        "id": next(_profile_ids),
+        "method": method,
+        "path": path,
+        "status_code": status_code,
+        "duration_ms": duration * 1000,
+        "created_at": datetime.utcnow(),
+        "top_functions": top,
+        # Same format as pstats.Stats.dump_stats, loadable by snakeviz/flameprof
+        "pstats": marshal.dumps(stats.stats),
+    }
+    profiles.append(record)
+    return record
+
+def get_profile(profile_id: int) -> Optional[dict]:
+    return next((record for record in profiles if record["id"] == profile_id), None)
+
+class ProfilingMiddleware:
+    """Runs selected requests under cProfile.
+
+    A request is profiled when it carries ``X-Profile: 1`` together with a valid
+    ``X-Admin-Token``, or when it is picked by ``PROFILE_SAMPLE_RATE``. The event loop
+    thread is profiled directly; sync endpoints running in the thread pool are
+    profiled by ``ProfiledRoute`` before Python 3.12 and merged into the same report;
+    later versions profile every thread from the middleware. Async work from
+    other requests interleaved on the event loop can show up in the report.
+    """
+
+    def __init__(self, app, sample_rate: float = PROFILE_SAMPLE_RATE):
+        self.app = app
+        self.sample_rate = sample_rate
+        # Only one profiler can be active on the event loop thread
+        self._busy = False
+
+    def _should_profile(self, scope) -> bool:
+        headers = dict(scope["headers"])
+        if headers.get(b"x-profile") == b"1" and is_admin_token(headers.get(b"x-admin-token", b"").decode("latin-1") or None):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._busy or scope["path"].startswith("/internal") or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = None
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        profile = _start_profile()
+        if profile is None:
+            await self.app(scope, receive, send)
+            return
+
+        self._busy = True
+        session = ProfileSession()
+        token = _active_session.set(session)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profile.disable()
+            self._busy = False
+            duration = time.perf_counter() - start
+            _active_session.reset(token)
+            session.add(profile)
+            try:
+                record = _record_profile(session, scope["method"], scope["path"], status_code, duration)
+                logger.info("Profiled %s %s in %.1f ms (profile %d)", record["method"], record["path"], record["duration_ms"], record["id"])
+            except Exception:
+                logger.exception("Failed to record profile for %s %s", scope["method"], scope["path"])
+
+def _profiled(endpoint):
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        session = _active_session.get()
+        profile = _start_profile() if session is not None else None
+        if profile is None:
+            return endpoint(*args, **kwargs)
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            profile.disable()
+            session.add(profile)
+    return wrapper
+
+class ProfiledRoute(APIRoute):
+    """Route class that lets a profiled request follow sync endpoints into the thread pool.
+
+    Endpoints are left untouched when profiling is not enabled, and on Python 3.12+
+    where the request's profiler already covers the thread pool.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        if PROFILING_ENABLED and PER_THREAD_PROFILING and not inspect.iscoroutinefunction(endpoint):
+            endpoint = _profiled(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+def _explain(conn, statement: str, parameters) -> Optional[List[str]]:
+    if not statement.lstrip().upper().startswith(("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")):
+        return None
+    sqlite = conn.dialect.name == "sqlite"
+    prefix = "EXPLAIN QUERY PLAN " if sqlite else "EXPLAIN "
+    # A separate DBAPI cursor keeps the original cursor's results intact and
+    # does not re-enter these event hooks.
+    cursor = conn.connection.cursor()
+    # It shares the request's transaction, which a failed statement aborts on
+    # PostgreSQL, so the EXPLAIN runs inside a savepoint that is rolled back
+    savepoint = not sqlite
+    try:
+        if savepoint:
+            cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            return [" | ".join(str(column) for column in row) for row in cursor.fetchall()]
+        finally:
+            if savepoint:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+    except Exception as e:
+        return [f"EXPLAIN failed: {e}"]
+    finally:
+        cursor.close()
+
+REDACTED = "[redacted]"
+SENSITIVE_PARAMETERS = ("password", "token", "jti", "secret")
+
+def _is_sensitive(name: str) -> bool:
+    return any(word in name.lower() for word in SENSITIVE_PARAMETERS)
+
+def _redact(parameters, names: Optional[List[str]]):
+    """Hide values bound to credential-like columns before they are stored or logged."""
+    if isinstance(parameters, dict):
+        return {name: REDACTED if _is_sensitive(name) else value for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)) and parameters and isinstance(parameters[0], (dict, list, tuple)):
+        return [_redact(row, names) for row in parameters]
+    if isinstance(parameters, (list, tuple)):
+        # Without bind names (raw SQL, batched inserts) nothing can be shown safely
+        if names is None or len(names) != len(parameters):
+            return [REDACTED] * len(parameters)
+        return [REDACTED if _is_sensitive(name) else value for name, value in zip(names, parameters)]
+    return parameters
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the execution context rather than the connection: after_cursor_execute
+    # does not fire for a statement that raises, and the context goes away with it
+    context._slow_query_start = time.perf_counter()
+
+def _make_after_cursor_execute(threshold_ms: float):
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration_ms = (time.perf_counter() - context._slow_query_start) * 1000
+        if duration_ms < threshold_ms:
+            return
+        # Positional parameters are matched to their bind names through the compiled statement
+        names = getattr(getattr(context, "compiled", None), "positiontup", None)
+        record = {
+            "id": next(_slow_query_ids),
+            "statement": statement,
+            "parameters": repr(_redact(parameters, names))[:1000],
+            "duration_ms": duration_ms,
+            "created_at": datetime.utcnow(),
+            "plan": None if executemany else _explain(conn, statement, parameters),
+        }
+        slow_queries.append(record)
+        logger.warning("Slow query (%.1f ms): %s %s", duration_ms, statement, record["parameters"])
+    return _after_cursor_execute
+
+_installed_listeners = {}
+
+def install_slow_query_log(engine: Engine, threshold_ms: float = SLOW_QUERY_MS) -> None:
+    remove_slow_query_log(engine)
+    after = _make_after_cursor_execute(threshold_ms)
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after)
+    _installed_listeners[engine] = after
+
+def remove_slow_query_log(engine: Engine) -> None:
+    after = _installed_listeners.pop(engine, None)
+    if after is not None:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", after)
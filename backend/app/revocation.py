@@ -0,0 +1,148 @@
+import hashlib
+import logging
+import math
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, List, Optional
+from sqlalchemy.orm import Session
+from dotenv import load_dotenv
+from app import crud
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_REFRESH_SECONDS = int(os.getenv("REVOCATION_REFRESH_SECONDS", "60"))
+REVOCATION_FALSE_POSITIVE_RATE = float(os.getenv("REVOCATION_FALSE_POSITIVE_RATE", "0.01"))
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, sized for a capacity and false positive rate."""
+
+    def __init__(self, capacity: int, error_rate: float = REVOCATION_FALSE_POSITIVE_RATE):
+        self.capacity = max(capacity, 1024)
+        self.size = int(math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / self.capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # Double hashing: derive all k positions from one 128-bit digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+class RevocationList:
+    """In-process view of the revoked_tokens table.
+
+    A Bloom filter answers "definitely not revoked" without touching the database;
+    only filter hits (real revocations or false positives) are confirmed with a query.
+    The filter is built once at start-up, after which a background thread prunes expired
+    rows and merges in revocations made by other processes every ``refresh_seconds``.
+    The filter is only rebuilt from scratch when it fills up, which also drops the
+    expired entries it still holds. Requests only ever read the filter.
+    """
+
+    def __init__(self, refresh_seconds: int = REVOCATION_REFRESH_SECONDS, error_rate: float = REVOCATION_FALSE_POSITIVE_RATE):
+        self.refresh_seconds = refresh_seconds
+        self.error_rate = error_rate
+        self._bloom = BloomFilter(0, error_rate)
+        self._synced_at: Optional[datetime] = None
+        # Revocations made while a rebuild is reading the table, replayed into the new filter
+        self._pending: Optional[List[str]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def rebuild(self, db: Session) -> None:
+        synced_at = datetime.utcnow()
+        with self._lock:
+            self._pending = []
+        try:
+            crud.prune_revoked_tokens(db)
+            jtis = crud.get_revoked_jtis(db)
+            # Leave headroom so incremental refreshes can add to it before the next rebuild
+            bloom = BloomFilter(2 * len(jtis), self.error_rate)
+            for jti in jtis:
+                bloom.add(jti)
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+        with self._lock:
+            for jti in self._pending:
+                bloom.add(jti)
+            self._pending = None
+            self._bloom = bloom
+        self._synced_at = synced_at
+
+    def refresh(self, db: Session) -> None:
+        if self._synced_at is None:
+            self.rebuild(db)
+            return
+        synced_at = datetime.utcnow()
+        crud.prune_revoked_tokens(db)
+        # Overlap the previous window to tolerate late commits and clock skew between processes
+        jtis = crud.get_revoked_jtis(db, since=self._synced_at - timedelta(seconds=self.refresh_seconds))
+        if self._bloom.count + len(jtis) > self._bloom.capacity:
+            self.rebuild(db)
+            return
+        with self._lock:
+            for jti in jtis:
+                if jti not in self._bloom:
+                    self._bloom.add(jti)
+        self._synced_at = synced_at
+
+    def _run(self, session_factory: Callable[[], Session]) -> None:
+        while not self._stop.wait(self.refresh_seconds):
+            db = session_factory()
+            try:
+                self.refresh(db)
+            except Exception:
+                logger.exception("Failed to refresh the revocation list")
+            finally:
+                db.close()
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """Build the filter and start refreshing it in the background."""
+        db = session_factory()
+        try:
+            self.rebuild(db)
+        finally:
+            db.close()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(session_factory,), name="revocation-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def revoke(self, db: Session, jti: str, expires_at: datetime) -> bool:
+        """Revoke a token; returns False if it had already been revoked."""
+        revoked = crud.revoke_token(db, jti, expires_at)
+        # Added under the lock so a concurrent rebuild cannot drop it
+        with self._lock:
+            self._bloom.add(jti)
+            if self._pending is not None:
+                self._pending.append(jti)
+        return revoked
+
+    def is_revoked(self, db: Session, jti: str) -> bool:
+        # Until the filter is built every check goes to the database
+        if self._synced_at is not None and jti not in self._bloom:
+            return False
+        return crud.is_token_revoked(db, jti)
+
+revocation_list = RevocationList()
@@ -1,12 +1,27 @@
+from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from jose import JWTError
 from sqlalchemy.orm import Session
 from app import schemas, crud
 from app.database import get_db
-from app.jwt_handler import create_access_token
-from app.dependencies import get_current_user
+from app.jwt_handler import create_access_token, create_refresh_token, decode_access_token, decode_refresh_token
+from app.dependencies import get_current_user, oauth2_scheme
+from app.revocation import revocation_list
+from app.profiling import ProfiledRoute
 from app import models
 
-router = APIRouter(prefix="", tags=["Authentication"])
+router = APIRouter(prefix="", tags=["Authentication"], route_class=ProfiledRoute)
+
+def _issue_tokens(user_id: int) -> dict:
+    return {
+        "access_token": create_access_token(data={"sub": str(user_id)}),
+        "refresh_token": create_refresh_token(data={"sub": str(user_id)}),
+        "token_type": "bearer",
+    }
+
+def _revoke(db: Session, payload: dict) -> bool:
+    return revocation_list.revoke(db, payload["jti"], datetime.utcfromtimestamp(payload["exp"]))
 
 @router.post("/register", response_model=schemas.UserResponse, status_code=status.HTTP_201_CREATED)
 def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
@@ -21,9 +36,35 @@ def login(user_credentials: schemas.UserLogin, db: Session = Depends(get_db)):
     user = crud.authenticate_user(db, user_credentials.email, user_credentials.password)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect email or password", headers={"WWW-Authenticate": "Bearer"})
-    access_token = create_access_token(data={"sub": str(user.id)})
-    return {"access_token": access_token, "token_type": "bearer"}
+    return _issue_tokens(user.id)
+
+@router.post("/refresh", response_model=schemas.Token)
+def refresh(token_refresh: schemas.TokenRefresh, db: Session = Depends(get_db)):
+    credentials_exception = HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token", headers={"WWW-Authenticate": "Bearer"})
+    try:
+        payload = decode_refresh_token(token_refresh.refresh_token)
+    except JWTError:
+        raise credentials_exception
+    user_id = payload.get("sub")
+    if user_id is None or payload.get("jti") is None or revocation_list.is_revoked(db, payload["jti"]):
+        raise credentials_exception
+    user = crud.get_user_by_id(db, user_id=int(user_id))
+    if user is None:
+        raise credentials_exception
+    # Refresh tokens are single-use: rotate on every refresh. The check above is
+    # only a fast path; a concurrent refresh with the same token loses here.
+    if not _revoke(db, payload):
+        raise credentials_exception
+    return _issue_tokens(user.id)
 
 @router.post("/logout", response_model=schemas.Message)
-def logout(current_user: models.User = Depends(get_current_user)):
+def logout(token_refresh: Optional[schemas.TokenRefresh] = None, token: str = Depends(oauth2_scheme), current_user: models.User = Depends(get_current_user), db: Session = Depends(get_db)):
+    _revoke(db, decode_access_token(token))
+    if token_refresh is not None:
+        try:
+            refresh_payload = decode_refresh_token(token_refresh.refresh_token)
+        except JWTError:
+            refresh_payload = None
+        if refresh_payload and refresh_payload.get("sub") == str(current_user.id) and refresh_payload.get("jti"):
+            _revoke(db, refresh_payload)
     return {"message": "Successfully logged out"}
\ No newline at end of file
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from typing import List, Optional
+from app import schemas, profiling
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    if not profiling.ADMIN_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not profiling.is_admin_token(x_admin_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin token required")
+
+router = APIRouter(prefix="/internal", tags=["Internal"], dependencies=[Depends(require_admin)], include_in_schema=False)
+
+@router.get("/profiles", response_model=List[schemas.ProfileSummary])
+def list_profiles():
+    return list(reversed(profiling.profiles))
+
+@router.get("/profiles/{profile_id}", response_model=schemas.ProfileDetail)
+def get_profile(profile_id: int):
+    record = profiling.get_profile(profile_id)
+    if not record:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return record
+
+@router.get("/profiles/{profile_id}/pstats")
+def download_profile(profile_id: int):
+    record = profiling.get_profile(profile_id)
+    if not record:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return Response(content=record["pstats"], media_type="application/octet-stream", headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.pstats"'})
+
+@router.get("/slow-queries", response_model=List[schemas.SlowQuery])
+def list_slow_queries():
+    return list(reversed(profiling.slow_queries))
\ No newline at end of file
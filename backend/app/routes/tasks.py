@@ -1,19 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app import schemas, crud, models
 from app.database import get_db
 from app.dependencies import get_current_user
+from app.profiling import ProfiledRoute
 
-router = APIRouter(prefix="/tasks", tags=["Tasks"])
+router = APIRouter(prefix="/tasks", tags=["Tasks"], route_class=ProfiledRoute)
 
 @router.post("", response_model=schemas.TaskResponse, status_code=status.HTTP_201_CREATED)
 def create_task(task: schemas.TaskCreate, current_user: models.User = Depends(get_current_user), db: Session = Depends(get_db)):
     return crud.create_task(db, task, current_user.id)
 
 @router.get("", response_model=List[schemas.TaskResponse])
-def get_tasks(skip: int = 0, limit: int = 100, current_user: models.User = Depends(get_current_user), db: Session = Depends(get_db)):
-    return crud.get_tasks(db, current_user.id, skip, limit)
+def get_tasks(skip: int = 0, limit: int = 100, after_id: Optional[int] = None, current_user: models.User = Depends(get_current_user), db: Session = Depends(get_db)):
+    return crud.get_tasks(db, current_user.id, skip, limit, after_id)
 
 @router.get("/{task_id}", response_model=schemas.TaskResponse)
 def get_task(task_id: int, current_user: models.User = Depends(get_current_user), db: Session = Depends(get_db)):
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class UserCreate(BaseModel):
@@ -20,8 +20,12 @@ class UserResponse(BaseModel):
 
 class Token(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str
 
+class TokenRefresh(BaseModel):
+    refresh_token: str
+
 class TokenData(BaseModel):
     user_id: Optional[int] = None
 
@@ -47,4 +51,29 @@ class TaskResponse(BaseModel):
         from_attributes = True
 
 class Message(BaseModel):
-    message: str
\ No newline at end of file
+    message: str
+
+class ProfileFunctionStat(BaseModel):
+    function: str
+    calls: int
+    total_time: float
+    cumulative_time: float
+
+class ProfileSummary(BaseModel):
+    id: int
+    method: str
+    path: str
+    status_code: Optional[int]
+    duration_ms: float
+    created_at: datetime
+
+class ProfileDetail(ProfileSummary):
+    top_functions: List[ProfileFunctionStat]
+
+class SlowQuery(BaseModel):
+    id: int
+    statement: str
+    parameters: str
+    duration_ms: float
+    created_at: datetime
+    plan: Optional[List[str]]
\ No newline at end of file
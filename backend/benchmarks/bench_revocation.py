@@ -0,0 +1,60 @@
+"""Per-request cost of the revocation check with a large revoked_tokens table.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_revocation [revoked_count]
+"""
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from app import crud, models
+from app.database import Base
+from app.revocation import RevocationList
+
+LOOKUPS = 20000
+
+def _time_per_call(func, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+def main(revoked_count: int = 1_000_000) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    # Existing revocations accumulated over the last day
+    expires_at = datetime.utcnow() + timedelta(days=1)
+    revoked_at = datetime.utcnow() - timedelta(hours=1)
+    revoked = [uuid.uuid4().hex for _ in range(revoked_count)]
+    with engine.begin() as conn:
+        conn.execute(insert(models.RevokedToken), [{"jti": jti, "expires_at": expires_at, "revoked_at": revoked_at} for jti in revoked])
+
+    revocations = RevocationList(refresh_seconds=60)
+    start = time.perf_counter()
+    revocations.rebuild(db)
+    print(f"rebuild with {revoked_count} revoked tokens: {time.perf_counter() - start:.2f}s")
+
+    with engine.begin() as conn:
+        conn.execute(insert(models.RevokedToken), [{"jti": uuid.uuid4().hex, "expires_at": expires_at} for _ in range(1000)])
+    start = time.perf_counter()
+    revocations.refresh(db)
+    print(f"periodic refresh picking up 1000 new revocations: {time.perf_counter() - start:.3f}s")
+
+    valid = [uuid.uuid4().hex for _ in range(LOOKUPS)]
+    print(f"filter check, valid token:   {_time_per_call(lambda jti: revocations.is_revoked(db, jti), valid):.2f} us")
+    print(f"filter check, revoked token: {_time_per_call(lambda jti: revocations.is_revoked(db, jti), revoked[:LOOKUPS]):.2f} us")
+    print(f"database lookup only:        {_time_per_call(lambda jti: crud.is_token_revoked(db, jti), valid):.2f} us")
+    false_positives = sum(1 for jti in valid if jti in revocations._bloom)
+    print(f"false positive rate:         {false_positives / LOOKUPS:.4f}")
+    db.close()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
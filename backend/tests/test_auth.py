@@ -1,4 +1,7 @@
+import threading
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -6,7 +9,9 @@ from sqlalchemy.orm import sessionmaker
 # Change these lines at the top:
 from app.database import Base, get_db
 from app.main import app
-from app import models  # Only in test_auth.py
+from app import crud, models  # Only in test_auth.py
+from app.revocation import BloomFilter, RevocationList, revocation_list
+from datetime import datetime, timedelta
 
 # Test database setup
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -151,4 +156,182 @@ class TestPasswordHashing:
         user = db.query(models.User).filter(models.User.email == "test@example.com").first()
         assert user.hashed_password != password
         assert len(user.hashed_password) > 50  # Bcrypt hashes are long
-        db.close()
\ No newline at end of file
+        db.close()
+
+def register_and_login(email="test@example.com", password="password123"):
+    client.post("/register", json={"email": email, "password": password})
+    return client.post("/login", json={"email": email, "password": password}).json()
+
+class TestLogout:
+    """Tests for token revocation on logout"""
+    
+    def test_logout_revokes_access_token(self):
+        """Test that an access token is rejected after logout"""
+        tokens = register_and_login()
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        assert client.get("/tasks", headers=headers).status_code == 200
+        
+        response = client.post("/logout", headers=headers)
+        assert response.status_code == 200
+        
+        assert client.get("/tasks", headers=headers).status_code == 401
+    
+    def test_logout_revokes_refresh_token(self):
+        """Test that a refresh token passed to logout can no longer be used"""
+        tokens = register_and_login()
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        client.post("/logout", json={"refresh_token": tokens["refresh_token"]}, headers=headers)
+        
+        response = client.post("/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 401
+    
+    def test_logout_does_not_affect_other_sessions(self):
+        """Test that logging out one session leaves other tokens valid"""
+        first = register_and_login()
+        second = client.post("/login", json={"email": "test@example.com", "password": "password123"}).json()
+        client.post("/logout", headers={"Authorization": f"Bearer {first['access_token']}"})
+        
+        response = client.get("/tasks", headers={"Authorization": f"Bearer {second['access_token']}"})
+        assert response.status_code == 200
+
+class TestTokenRefresh:
+    """Tests for refresh tokens"""
+    
+    def test_refresh_issues_new_tokens(self):
+        """Test that a refresh token yields a working access token"""
+        tokens = register_and_login()
+        response = client.post("/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["access_token"] != tokens["access_token"]
+        assert data["refresh_token"] != tokens["refresh_token"]
+        
+        headers = {"Authorization": f"Bearer {data['access_token']}"}
+        assert client.get("/tasks", headers=headers).status_code == 200
+    
+    def test_refresh_token_is_single_use(self):
+        """Test that a refresh token is rotated after use"""
+        tokens = register_and_login()
+        client.post("/refresh", json={"refresh_token": tokens["refresh_token"]})
+        response = client.post("/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 401
+    
+    def test_refresh_token_reuse_detected_after_check(self, monkeypatch):
+        """Test that a reuse slipping past the revocation check is still rejected"""
+        tokens = register_and_login()
+        client.post("/refresh", json={"refresh_token": tokens["refresh_token"]})
+        # As if a concurrent refresh revoked the token just after this one checked it
+        monkeypatch.setattr(revocation_list, "is_revoked", lambda db, jti: False)
+        
+        response = client.post("/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 401
+    
+    def test_concurrent_refresh_issues_one_pair(self):
+        """Test that racing refreshes with the same token succeed exactly once"""
+        tokens = register_and_login()
+        barrier = threading.Barrier(5)
+        
+        def refresh():
+            barrier.wait()
+            return client.post("/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code
+        
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            statuses = list(executor.map(lambda _: refresh(), range(5)))
+        assert sorted(statuses) == [200, 401, 401, 401, 401]
+    
+    def test_access_token_cannot_refresh(self):
+        """Test that an access token is rejected by the refresh endpoint"""
+        tokens = register_and_login()
+        response = client.post("/refresh", json={"refresh_token": tokens["access_token"]})
+        assert response.status_code == 401
+    
+    def test_refresh_token_cannot_authenticate(self):
+        """Test that a refresh token is rejected as a bearer token"""
+        tokens = register_and_login()
+        headers = {"Authorization": f"Bearer {tokens['refresh_token']}"}
+        assert client.get("/tasks", headers=headers).status_code == 401
+
+class TestRevocationList:
+    """Tests for the in-memory revocation filter"""
+    
+    def test_bloom_filter_has_no_false_negatives(self):
+        """Every added item must be reported as present"""
+        bloom = BloomFilter(1000)
+        items = [f"jti-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+        assert all(item in bloom for item in items)
+        false_positives = sum(f"other-{i}" in bloom for i in range(1000))
+        assert false_positives < 50
+    
+    def test_rebuild_prunes_expired_entries(self):
+        """Test that expired revocations are removed from the table"""
+        db = TestingSessionLocal()
+        revocations = RevocationList(refresh_seconds=3600)
+        revocations.revoke(db, "expired", datetime.utcnow() - timedelta(minutes=1))
+        revocations.revoke(db, "active", datetime.utcnow() + timedelta(minutes=10))
+        
+        revocations.rebuild(db)
+        
+        jtis = [token.jti for token in db.query(models.RevokedToken).all()]
+        assert jtis == ["active"]
+        assert revocations.is_revoked(db, "active")
+        assert not revocations.is_revoked(db, "expired")
+        db.close()
+    
+    def test_refresh_picks_up_revocations_from_other_processes(self):
+        """Test that rows written by another process reach the filter on refresh"""
+        db = TestingSessionLocal()
+        revocations = RevocationList(refresh_seconds=3600)
+        revocations.rebuild(db)
+        
+        db.add(models.RevokedToken(jti="elsewhere", expires_at=datetime.utcnow() + timedelta(minutes=10)))
+        db.commit()
+        # Checks only read the filter; the refresh happens off the request path
+        assert not revocations.is_revoked(db, "elsewhere")
+        
+        revocations.refresh(db)
+        assert revocations.is_revoked(db, "elsewhere")
+        db.close()
+    
+    def test_check_without_filter_uses_database(self):
+        """Test that checks before start-up are answered by the database"""
+        db = TestingSessionLocal()
+        db.add(models.RevokedToken(jti="revoked", expires_at=datetime.utcnow() + timedelta(minutes=10)))
+        db.commit()
+        
+        revocations = RevocationList()
+        assert revocations.is_revoked(db, "revoked")
+        assert not revocations.is_revoked(db, "valid")
+        db.close()
+    
+    def test_check_does_not_query_database_for_valid_tokens(self, monkeypatch):
+        """Test that a filter miss is answered without a query or a refresh"""
+        db = TestingSessionLocal()
+        revocations = RevocationList(refresh_seconds=0)
+        revocations.rebuild(db)
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("database used on the request path")
+        monkeypatch.setattr(crud, "is_token_revoked", fail)
+        monkeypatch.setattr(crud, "get_revoked_jtis", fail)
+        monkeypatch.setattr(crud, "prune_revoked_tokens", fail)
+        
+        assert not revocations.is_revoked(db, "valid")
+        db.close()
+    
+    def test_background_refresh(self):
+        """Test that the background thread merges in new revocations"""
+        revocations = RevocationList(refresh_seconds=0.01)
+        revocations.start(TestingSessionLocal)
+        try:
+            db = TestingSessionLocal()
+            db.add(models.RevokedToken(jti="elsewhere", expires_at=datetime.utcnow() + timedelta(minutes=10)))
+            db.commit()
+            deadline = time.monotonic() + 5
+            while "elsewhere" not in revocations._bloom and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert revocations.is_revoked(db, "elsewhere")
+            db.close()
+        finally:
+            revocations.stop()
@@ -0,0 +1,229 @@
+import cProfile
+import marshal
+import pytest
+from datetime import datetime, timedelta
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, get_db
+from app import crud, models
+from app.main import app
+from app import profiling
+from app.routes import internal, tasks
+
+# Test database setup
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+app.dependency_overrides[get_db] = override_get_db
+client = TestClient(app)
+
+ADMIN_HEADERS = {"X-Admin-Token": "secret"}
+
+@pytest.fixture(autouse=True)
+def setup_database():
+    """Create tables before each test and drop after"""
+    Base.metadata.create_all(bind=engine)
+    profiling.profiles.clear()
+    profiling.slow_queries.clear()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def admin_token(monkeypatch):
+    """Configure an admin token for the duration of a test"""
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", "secret")
+
+@pytest.fixture
+def profiled_client(monkeypatch, admin_token):
+    """A small app with profiling enabled and a sync endpoint that does some work"""
+    monkeypatch.setattr(profiling, "PROFILING_ENABLED", True)
+    router = APIRouter(route_class=profiling.ProfiledRoute)
+
+    @router.get("/work")
+    def busy_endpoint():
+        return {"total": sum(i * i for i in range(20000))}
+
+    profiled_app = FastAPI()
+    profiled_app.add_middleware(profiling.ProfilingMiddleware, sample_rate=0)
+    profiled_app.include_router(router)
+    profiled_app.include_router(internal.router)
+    return TestClient(profiled_app)
+
+@pytest.fixture
+def slow_query_log(monkeypatch):
+    """Record every statement on the test engine"""
+    # Other test modules override get_db with their own engine
+    monkeypatch.setitem(app.dependency_overrides, get_db, override_get_db)
+    profiling.install_slow_query_log(engine, threshold_ms=0)
+    yield
+    profiling.remove_slow_query_log(engine)
+
+@pytest.fixture
+def auth_headers():
+    """Create a user and return authorization headers"""
+    client.post("/register", json={"email": "test@example.com", "password": "password123"})
+    response = client.post("/login", json={"email": "test@example.com", "password": "password123"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+class TestDisabledByDefault:
+    """Tests that diagnostics cost nothing unless configured"""
+
+    def test_no_profiling_middleware_installed(self):
+        """The middleware is only added when profiling is configured"""
+        assert not any(m.cls is profiling.ProfilingMiddleware for m in app.user_middleware)
+
+    def test_endpoints_not_wrapped(self):
+        """Route endpoints are left untouched when profiling is disabled"""
+        assert all(not hasattr(route.endpoint, "__wrapped__") for route in tasks.router.routes)
+
+    def test_internal_endpoints_hidden_without_admin_token(self):
+        """Internal endpoints do not exist unless an admin token is configured"""
+        response = client.get("/internal/profiles", headers=ADMIN_HEADERS)
+        assert response.status_code == 404
+
+class TestRequestProfiling:
+    """Tests for on-demand request profiling"""
+
+    def test_request_profiled_with_admin_header(self, profiled_client):
+        """A request with X-Profile and a valid admin token is profiled"""
+        response = profiled_client.get("/work", headers={"X-Profile": "1", **ADMIN_HEADERS})
+        assert response.status_code == 200
+
+        profiles = profiled_client.get("/internal/profiles", headers=ADMIN_HEADERS).json()
+        assert len(profiles) == 1
+        assert profiles[0]["path"] == "/work"
+        assert profiles[0]["status_code"] == 200
+
+        detail = profiled_client.get(f"/internal/profiles/{profiles[0]['id']}", headers=ADMIN_HEADERS).json()
+        # The sync endpoint runs in the thread pool and must still be captured
+        assert any("busy_endpoint" in stat["function"] for stat in detail["top_functions"])
+
+    def test_profile_downloadable_as_pstats(self, profiled_client):
+        """The raw profile can be loaded by pstats-compatible tools"""
+        profiled_client.get("/work", headers={"X-Profile": "1", **ADMIN_HEADERS})
+        profile_id = profiling.profiles[-1]["id"]
+
+        response = profiled_client.get(f"/internal/profiles/{profile_id}/pstats", headers=ADMIN_HEADERS)
+        assert response.status_code == 200
+        assert isinstance(marshal.loads(response.content), dict)
+
+    def test_profiler_failure_does_not_fail_request(self, profiled_client, monkeypatch):
+        """A profiler that cannot start leaves the request unprofiled but successful"""
+        def enable(self):
+            raise ValueError("Another profiling tool is already active")
+        monkeypatch.setattr(cProfile.Profile, "enable", enable)
+
+        response = profiled_client.get("/work", headers={"X-Profile": "1", **ADMIN_HEADERS})
+        assert response.status_code == 200
+        assert len(profiling.profiles) == 0
+
+    def test_sync_endpoints_wrapped_only_before_python_312(self, profiled_client):
+        """On 3.12+ the middleware's profiler already covers the thread pool"""
+        route = next(r for r in profiled_client.app.routes if getattr(r, "path", None) == "/work")
+        assert hasattr(route.endpoint, "__wrapped__") == profiling.PER_THREAD_PROFILING
+
+    def test_request_not_profiled_with_wrong_token(self, profiled_client):
+        """An invalid admin token does not trigger profiling"""
+        profiled_client.get("/work", headers={"X-Profile": "1", "X-Admin-Token": "wrong"})
+        assert len(profiling.profiles) == 0
+
+    def test_request_not_profiled_without_header(self, profiled_client):
+        """Ordinary requests are not profiled when sampling is off"""
+        profiled_client.get("/work")
+        assert len(profiling.profiles) == 0
+
+    def test_internal_endpoints_require_admin_token(self, profiled_client):
+        """Internal endpoints reject requests without the admin token"""
+        response = profiled_client.get("/internal/profiles")
+        assert response.status_code == 403
+
+    def test_unknown_profile(self, profiled_client):
+        """Requesting a missing profile returns 404"""
+        response = profiled_client.get("/internal/profiles/99999", headers=ADMIN_HEADERS)
+        assert response.status_code == 404
+
+class TestSlowQueryLog:
+    """Tests for slow query capture"""
+
+    def test_slow_queries_recorded_with_plan(self, admin_token, slow_query_log, auth_headers):
+        """Statements over the threshold are stored with parameters and a query plan"""
+        client.post("/tasks", json={"title": "Task"}, headers=auth_headers)
+        profiling.slow_queries.clear()
+
+        client.get("/tasks", headers=auth_headers)
+
+        response = client.get("/internal/slow-queries", headers=ADMIN_HEADERS)
+        assert response.status_code == 200
+        queries = response.json()
+        task_query = next(q for q in queries if "FROM tasks" in q["statement"])
+        assert task_query["duration_ms"] >= 0
+        assert task_query["parameters"]
+        assert task_query["plan"]
+        assert not any("EXPLAIN failed" in line for line in task_query["plan"])
+
+    def test_fast_queries_ignored(self, auth_headers):
+        """Statements under the threshold are not recorded"""
+        profiling.install_slow_query_log(engine, threshold_ms=60000)
+        try:
+            client.get("/tasks", headers=auth_headers)
+        finally:
+            profiling.remove_slow_query_log(engine)
+        assert len(profiling.slow_queries) == 0
+
+    def test_failed_statements_leave_no_state_on_connection(self, slow_query_log):
+        """Statements that raise do not accumulate timing state on the pooled connection"""
+        db = TestingSessionLocal()
+        expires_at = datetime.utcnow() + timedelta(minutes=10)
+        assert crud.revoke_token(db, "reused", expires_at)
+        for _ in range(4):
+            assert not crud.revoke_token(db, "reused", expires_at)
+        connection = db.connection()
+        assert "query_start_time" not in connection.info
+        db.close()
+
+    def test_sensitive_parameters_redacted(self, slow_query_log, auth_headers, caplog):
+        """Password hashes and token ids never reach the slow query log"""
+        client.post("/logout", headers=auth_headers)
+        db = TestingSessionLocal()
+        secrets = [db.query(models.User).one().hashed_password] + [token.jti for token in db.query(models.RevokedToken)]
+        db.close()
+
+        recorded = " ".join(query["parameters"] for query in profiling.slow_queries) + caplog.text
+        assert profiling.REDACTED in recorded
+        assert "test@example.com" in recorded
+        assert not any(secret in recorded for secret in secrets)
+
+    def test_explain_failure_rolled_back_to_savepoint(self):
+        """A failing EXPLAIN cannot abort the request's transaction"""
+        executed = []
+
+        class Cursor:
+            def execute(self, statement, parameters=None):
+                executed.append(statement.split()[0])
+                if statement.startswith("EXPLAIN"):
+                    raise RuntimeError("syntax error")
+
+            def close(self):
+                pass
+
+        class Connection:
+            class dialect:
+                name = "postgresql"
+
+            class connection:
+                cursor = Cursor
+
+        plan = profiling._explain(Connection(), "SELECT 1", {})
+        assert plan == ["EXPLAIN failed: syntax error"]
+        assert executed == ["SAVEPOINT", "EXPLAIN", "ROLLBACK", "RELEASE"]
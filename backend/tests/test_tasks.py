@@ -135,6 +135,17 @@ class TestTaskRetrieval:
         assert data[0]["title"] == "Task 1"
         assert data[1]["title"] == "Task 2"
     
+    def test_get_tasks_after_id(self, auth_headers):
+        """Test that pages continue after the last seen id even when earlier tasks are deleted"""
+        ids = [client.post("/tasks", json={"title": f"Task {i}"}, headers=auth_headers).json()["id"] for i in range(5)]
+        first_page = client.get("/tasks", params={"limit": 2}, headers=auth_headers).json()
+        
+        client.delete(f"/tasks/{ids[0]}", headers=auth_headers)
+        
+        response = client.get("/tasks", params={"after_id": first_page[-1]["id"], "limit": 2}, headers=auth_headers)
+        assert response.status_code == 200
+        assert [task["id"] for task in response.json()] == ids[2:4]
+    
     def test_get_tasks_unauthorized(self):
         """Test getting tasks without authentication"""
         response = client.get("/tasks")
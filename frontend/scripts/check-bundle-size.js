@@ -0,0 +1,88 @@
+#!/usr/bin/env node
+// Reports the gzipped size of every JavaScript chunk in build/ and exits
+// non-zero when a chunk or the total goes over its budget.
+// Run after `npm run build`, or use `npm run build:size`.
+//
+// Budgets live in bundle-budgets.json and are taken from a real build:
+// `npm run size -- --update` records the current sizes plus HEADROOM.
+
+const fs = require("fs");
+const path = require("path");
+const zlib = require("zlib");
+
+const JS_DIR = path.join(__dirname, "..", "build", "static", "js");
+const BUDGETS_FILE = path.join(__dirname, "..", "bundle-budgets.json");
+const KB = 1024;
+
+// Growth allowed over the recorded sizes before the check fails
+const HEADROOM = 1.1;
+
+const formatKB = (bytes) => `${(bytes / KB).toFixed(1)} kB`;
+const withHeadroom = (bytes) => Math.ceil((bytes * HEADROOM) / 512) * 512;
+
+if (!fs.existsSync(JS_DIR)) {
+  console.error(`No build found at ${JS_DIR}. Run "npm run build" first.`);
+  process.exit(1);
+}
+
+const chunks = fs
+  .readdirSync(JS_DIR)
+  .filter((file) => file.endsWith(".js"))
+  .map((file) => {
+    const contents = fs.readFileSync(path.join(JS_DIR, file));
+    // The part of the file name before the hash: main, tasks, register or a numeric id
+    const name = file.split(".")[0];
+    const gzipped = zlib.gzipSync(contents, { level: 9 }).length;
+    return { file, name, size: contents.length, gzipped };
+  })
+  .sort((a, b) => b.gzipped - a.gzipped);
+
+const total = chunks.reduce((sum, chunk) => sum + chunk.gzipped, 0);
+
+if (process.argv.includes("--update")) {
+  const budgets = { chunks: {}, total: withHeadroom(total) };
+  chunks.forEach((chunk) => {
+    budgets.chunks[chunk.name] = withHeadroom(chunk.gzipped);
+  });
+  fs.writeFileSync(BUDGETS_FILE, `${JSON.stringify(budgets, null, 2)}\n`);
+  console.log(`Recorded budgets for ${chunks.length} chunks in ${path.basename(BUDGETS_FILE)}.`);
+}
+
+const budgets = fs.existsSync(BUDGETS_FILE) ? JSON.parse(fs.readFileSync(BUDGETS_FILE, "utf8")) : null;
+const budgetFor = (name) => (budgets ? budgets.chunks[name] : undefined);
+
+let failed = false;
+console.log("Chunk".padEnd(40), "Size".padStart(10), "Gzipped".padStart(10), "Budget".padStart(10));
+chunks.forEach((chunk) => {
+  const budget = budgetFor(chunk.name);
+  const problem = budget === undefined ? "  NO BUDGET" : chunk.gzipped > budget ? "  OVER BUDGET" : "";
+  failed = failed || problem !== "";
+  console.log(
+    chunk.file.padEnd(40),
+    formatKB(chunk.size).padStart(10),
+    formatKB(chunk.gzipped).padStart(10),
+    (budget === undefined ? "-" : formatKB(budget)).padStart(10),
+    problem
+  );
+});
+
+const totalBudget = budgets ? budgets.total : undefined;
+const totalOver = totalBudget === undefined || total > totalBudget;
+console.log(
+  "Total".padEnd(40),
+  "".padStart(10),
+  formatKB(total).padStart(10),
+  (totalBudget === undefined ? "-" : formatKB(totalBudget)).padStart(10),
+  totalBudget === undefined ? "  NO BUDGET" : total > totalBudget ? "  OVER BUDGET" : ""
+);
+
+if (!budgets) {
+  console.error(`\nNo budgets recorded. Run "npm run size -- --update" on a production build.`);
+  process.exit(1);
+}
+if (failed || totalOver) {
+  console.error(
+    "\nBundle size budget exceeded. If the growth is intended, record new budgets with \"npm run size -- --update\"."
+  );
+  process.exit(1);
+}
@@ -1,25 +1,38 @@
-import { useState, useEffect } from "react";
+import { lazy, Suspense, useState } from "react";
 import Login from "./components/Login";
-import Register from "./components/Register";
-import Tasks from "./components/Tasks";
+import { clearCache } from "./dataClient";
+
+// Login is the entry screen and stays in the main bundle; the other routes
+// are split into their own chunks and only downloaded when first shown.
+const loadTasks = () => import(/* webpackChunkName: "tasks" */ "./components/Tasks");
+const Tasks = lazy(loadTasks);
+// Starts the download early. A failure is ignored here and surfaces when
+// React.lazy imports the chunk again to render it.
+const preloadTasks = () => {
+  loadTasks().catch(() => {});
+};
+const Register = lazy(() => import(/* webpackChunkName: "register" */ "./components/Register"));
+
+const routeFallback = (
+  <div className="min-h-screen flex items-center justify-center text-gray-600">
+    Loading...
+  </div>
+);
 
 function App() {
-  const [isAuthenticated, setIsAuthenticated] = useState(false);
+  // Read the token up front so returning users start loading Tasks right
+  // away instead of rendering the login screen first.
+  const [isAuthenticated, setIsAuthenticated] = useState(() => Boolean(localStorage.getItem("token")));
   const [showRegister, setShowRegister] = useState(false);
 
-  useEffect(() => {
-    const token = localStorage.getItem("token");
-    if (token) {
-      setIsAuthenticated(true);
-    }
-  }, []);
-
   const handleLogin = () => {
     setIsAuthenticated(true);
   };
 
   const handleLogout = () => {
     localStorage.removeItem("token");
+    localStorage.removeItem("refresh_token");
+    clearCache();
     setIsAuthenticated(false);
   };
 
@@ -28,21 +41,29 @@ function App() {
   };
 
   if (isAuthenticated) {
-    return <Tasks onLogout={handleLogout} />;
+    return (
+      <Suspense fallback={routeFallback}>
+        <Tasks onLogout={handleLogout} />
+      </Suspense>
+    );
   }
 
   if (showRegister) {
     return (
-      <Register
-        onSwitchToLogin={() => setShowRegister(false)}
-        onRegisterSuccess={handleRegisterSuccess}
-      />
+      <Suspense fallback={routeFallback}>
+        <Register
+          onSwitchToLogin={() => setShowRegister(false)}
+          onRegisterSuccess={handleRegisterSuccess}
+        />
+      </Suspense>
     );
   }
 
+  // The Tasks chunk is downloaded while the login request is in flight
   return (
     <Login
       onLogin={handleLogin}
+      onLoginStart={preloadTasks}
       onSwitchToRegister={() => setShowRegister(true)}
     />
   );
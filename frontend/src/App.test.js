@@ -0,0 +1,77 @@
+import { render, screen, fireEvent, waitFor } from '@testing-library/react';
+import '@testing-library/jest-dom';
+import App from './App';
+import API from './api';
+
+jest.mock('./api');
+
+// Record when the lazily loaded route modules are first required
+let mockTasksLoaded = false;
+let mockRegisterLoaded = false;
+
+jest.mock('./components/Tasks', () => {
+  mockTasksLoaded = true;
+  return { __esModule: true, default: () => 'Tasks Screen' };
+});
+
+jest.mock('./components/Register', () => {
+  mockRegisterLoaded = true;
+  return { __esModule: true, default: () => 'Register Screen' };
+});
+
+describe('App Component', () => {
+  beforeEach(() => {
+    jest.clearAllMocks();
+    localStorage.clear();
+  });
+
+  // ============================================
+  // CODE SPLITTING TESTS
+  // ============================================
+
+  test('renders the login screen without loading other routes', () => {
+    render(<App />);
+
+    expect(screen.getByText('Welcome Back')).toBeInTheDocument();
+    expect(mockTasksLoaded).toBe(false);
+    expect(mockRegisterLoaded).toBe(false);
+  });
+
+  test('loads the register route when requested', async () => {
+    render(<App />);
+
+    fireEvent.click(screen.getByTestId('switch-to-register'));
+
+    expect(await screen.findByText('Register Screen')).toBeInTheDocument();
+    expect(mockRegisterLoaded).toBe(true);
+  });
+
+  test('loads the tasks route while the login request is in flight', async () => {
+    let resolveLogin;
+    API.post.mockReturnValueOnce(new Promise((resolve) => { resolveLogin = resolve; }));
+
+    render(<App />);
+
+    fireEvent.change(screen.getByTestId('email-input'), { target: { value: 'test@example.com' } });
+    fireEvent.change(screen.getByTestId('password-input'), { target: { value: 'password123' } });
+    fireEvent.click(screen.getByTestId('login-button'));
+
+    await waitFor(() => {
+      expect(mockTasksLoaded).toBe(true);
+    });
+    expect(screen.getByText('Welcome Back')).toBeInTheDocument();
+
+    resolveLogin({ data: { access_token: 'token', refresh_token: 'refresh', token_type: 'bearer' } });
+
+    expect(await screen.findByText('Tasks Screen')).toBeInTheDocument();
+  });
+
+  test('goes straight to tasks for a returning user', async () => {
+    localStorage.setItem('token', 'token');
+
+    render(<App />);
+
+    expect(await screen.findByText('Tasks Screen')).toBeInTheDocument();
+    expect(screen.queryByText('Welcome Back')).not.toBeInTheDocument();
+  });
+});
@@ -13,6 +13,12 @@ API.interceptors.request.use(
     if (token) {
       config.headers.Authorization = `Bearer ${token}`;
     }
+    // Logout also revokes the refresh token. It is read here, at send time, so
+    // a logout retried after a token refresh revokes the rotated token.
+    if (config.url === "/logout") {
+      const refreshToken = localStorage.getItem("refresh_token");
+      config.data = refreshToken ? { refresh_token: refreshToken } : undefined;
+    }
     return config;
   },
   (error) => {
@@ -20,13 +26,45 @@ API.interceptors.request.use(
   }
 );
 
+// Access tokens are short-lived; a single in-flight refresh is shared by all
+// requests that fail with 401 at the same time.
+let refreshPromise = null;
+
+const refreshAccessToken = () => {
+  if (!refreshPromise) {
+    const refreshToken = localStorage.getItem("refresh_token");
+    refreshPromise = API.post("/refresh", { refresh_token: refreshToken }, { _retry: true })
+      .then((response) => {
+        localStorage.setItem("token", response.data.access_token);
+        localStorage.setItem("refresh_token", response.data.refresh_token);
+        return response.data.access_token;
+      })
+      .finally(() => {
+        refreshPromise = null;
+      });
+  }
+  return refreshPromise;
+};
+
 API.interceptors.response.use(
   (response) => {
     return response;
   },
-  (error) => {
+  async (error) => {
+    const config = error.config;
     if (error.response && error.response.status === 401) {
+      if (config && !config._retry && localStorage.getItem("refresh_token")) {
+        config._retry = true;
+        try {
+          const token = await refreshAccessToken();
+          config.headers.Authorization = `Bearer ${token}`;
+          return API(config);
+        } catch (refreshError) {
+          // Fall through to a full logout below
+        }
+      }
       localStorage.removeItem("token");
+      localStorage.removeItem("refresh_token");
       window.location.href = "/";
     }
     return Promise.reject(error);
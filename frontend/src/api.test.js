@@ -0,0 +1,141 @@
+import API from './api';
+
+// axios' default entry is an ES module that Jest does not transform from
+// node_modules; load its CommonJS build for this suite only.
+jest.mock('axios', () => jest.requireActual('axios/dist/browser/axios.cjs'));
+
+// Exercises the real interceptors; only the network adapter is replaced.
+// Each handler returns [status, data] for a request.
+const mockServer = (handler) => {
+  const adapter = jest.fn((config) => {
+    const [status, data] = handler(config);
+    const response = { data, status, statusText: '', headers: {}, config, request: {} };
+    if (status >= 400) {
+      return Promise.reject({ config, response, isAxiosError: true });
+    }
+    return Promise.resolve(response);
+  });
+  API.defaults.adapter = adapter;
+  return adapter;
+};
+
+const callsTo = (adapter, url) => adapter.mock.calls.map(([config]) => config).filter((config) => config.url === url);
+
+const bodyOf = (config) => (config.data ? JSON.parse(config.data) : undefined);
+
+describe('API client', () => {
+  const originalLocation = window.location;
+
+  beforeAll(() => {
+    delete window.location;
+    window.location = { href: '' };
+  });
+
+  afterAll(() => {
+    window.location = originalLocation;
+  });
+
+  beforeEach(() => {
+    localStorage.clear();
+    window.location.href = '';
+  });
+
+  // ============================================
+  // REQUEST INTERCEPTOR TESTS
+  // ============================================
+
+  test('sends the access token as a bearer token', async () => {
+    localStorage.setItem('token', 'access-1');
+    const adapter = mockServer(() => [200, []]);
+
+    await API.get('/tasks');
+
+    expect(adapter.mock.calls[0][0].headers.Authorization).toBe('Bearer access-1');
+  });
+
+  test('logout sends the stored refresh token', async () => {
+    localStorage.setItem('token', 'access-1');
+    localStorage.setItem('refresh_token', 'refresh-1');
+    const adapter = mockServer(() => [200, { message: 'Successfully logged out' }]);
+
+    await API.post('/logout');
+
+    expect(bodyOf(callsTo(adapter, '/logout')[0])).toEqual({ refresh_token: 'refresh-1' });
+  });
+
+  test('logout without a refresh token sends no body', async () => {
+    localStorage.setItem('token', 'access-1');
+    const adapter = mockServer(() => [200, { message: 'Successfully logged out' }]);
+
+    await API.post('/logout');
+
+    expect(bodyOf(callsTo(adapter, '/logout')[0])).toBeUndefined();
+  });
+
+  // ============================================
+  // TOKEN REFRESH TESTS
+  // ============================================
+
+  test('retries a 401 once with a refreshed access token', async () => {
+    localStorage.setItem('token', 'access-1');
+    localStorage.setItem('refresh_token', 'refresh-1');
+    const adapter = mockServer((config) => {
+      if (config.url === '/refresh') {
+        return [200, { access_token: 'access-2', refresh_token: 'refresh-2', token_type: 'bearer' }];
+      }
+      return config.headers.Authorization === 'Bearer access-2' ? [200, ['task']] : [401, {}];
+    });
+
+    const response = await API.get('/tasks');
+
+    expect(response.data).toEqual(['task']);
+    expect(bodyOf(callsTo(adapter, '/refresh')[0])).toEqual({ refresh_token: 'refresh-1' });
+    expect(localStorage.getItem('token')).toBe('access-2');
+    expect(localStorage.getItem('refresh_token')).toBe('refresh-2');
+  });
+
+  test('concurrent 401s share a single refresh', async () => {
+    localStorage.setItem('token', 'access-1');
+    localStorage.setItem('refresh_token', 'refresh-1');
+    const adapter = mockServer((config) => {
+      if (config.url === '/refresh') {
+        return [200, { access_token: 'access-2', refresh_token: 'refresh-2', token_type: 'bearer' }];
+      }
+      return config.headers.Authorization === 'Bearer access-2' ? [200, []] : [401, {}];
+    });
+
+    await Promise.all([API.get('/tasks'), API.get('/tasks', { params: { skip: 50 } })]);
+
+    expect(callsTo(adapter, '/refresh')).toHaveLength(1);
+  });
+
+  test('a logout retried after a refresh revokes the rotated refresh token', async () => {
+    localStorage.setItem('token', 'access-1');
+    localStorage.setItem('refresh_token', 'refresh-1');
+    const adapter = mockServer((config) => {
+      if (config.url === '/refresh') {
+        return [200, { access_token: 'access-2', refresh_token: 'refresh-2', token_type: 'bearer' }];
+      }
+      return config.headers.Authorization === 'Bearer access-2' ? [200, {}] : [401, {}];
+    });
+
+    await API.post('/logout');
+
+    const logouts = callsTo(adapter, '/logout');
+    expect(logouts).toHaveLength(2);
+    expect(bodyOf(logouts[0])).toEqual({ refresh_token: 'refresh-1' });
+    expect(bodyOf(logouts[1])).toEqual({ refresh_token: 'refresh-2' });
+  });
+
+  test('a failed refresh clears the session and returns to login', async () => {
+    localStorage.setItem('token', 'access-1');
+    localStorage.setItem('refresh_token', 'refresh-1');
+    mockServer(() => [401, {}]);
+
+    await expect(API.get('/tasks')).rejects.toBeTruthy();
+
+    expect(localStorage.getItem('token')).toBeNull();
+    expect(localStorage.getItem('refresh_token')).toBeNull();
+    expect(window.location.href).toBe('/');
+  });
+});
@@ -7,7 +7,7 @@ import FormInput from "./auth/FormInput";
 import ErrorAlert from "./auth/ErrorAlert";
 import SubmitButton from "./auth/SubmitButton";
 
-function Login({ onLogin, onSwitchToRegister }) {
+function Login({ onLogin, onLoginStart, onSwitchToRegister }) {
   const [email, setEmail] = useState("");
   const [password, setPassword] = useState("");
   const [loading, setLoading] = useState(false);
@@ -30,10 +30,16 @@ function Login({ onLogin, onSwitchToRegister }) {
 
     try {
       setLoading(true);
+      if (onLoginStart) {
+        onLoginStart();
+      }
       const response = await API.post("/login", { email, password });
       
       if (response.data && response.data.access_token) {
         localStorage.setItem("token", response.data.access_token);
+        if (response.data.refresh_token) {
+          localStorage.setItem("refresh_token", response.data.refresh_token);
+        }
         onLogin();
       } else {
         setError("Invalid response from server");
@@ -219,6 +219,52 @@ describe('Login Component', () => {
     });
   });
 
+  test('calls onLoginStart before the login request completes', async () => {
+    const mockOnLoginStart = jest.fn();
+    API.post.mockReturnValueOnce(new Promise(() => {}));
+
+    render(
+      <Login
+        onLogin={mockOnLogin}
+        onLoginStart={mockOnLoginStart}
+        onSwitchToRegister={mockOnSwitchToRegister}
+      />
+    );
+
+    fireEvent.change(screen.getByTestId('email-input'), {
+      target: { value: 'test@example.com' },
+    });
+    fireEvent.change(screen.getByTestId('password-input'), {
+      target: { value: 'password123' },
+    });
+
+    fireEvent.click(screen.getByTestId('login-button'));
+
+    await waitFor(() => {
+      expect(mockOnLoginStart).toHaveBeenCalledTimes(1);
+    });
+    expect(mockOnLogin).not.toHaveBeenCalled();
+  });
+
+  test('does not call onLoginStart when validation fails', async () => {
+    const mockOnLoginStart = jest.fn();
+
+    render(
+      <Login
+        onLogin={mockOnLogin}
+        onLoginStart={mockOnLoginStart}
+        onSwitchToRegister={mockOnSwitchToRegister}
+      />
+    );
+
+    fireEvent.click(screen.getByTestId('login-button'));
+
+    await waitFor(() => {
+      expect(screen.getByText('Please fill in all fields')).toBeInTheDocument();
+    });
+    expect(mockOnLoginStart).not.toHaveBeenCalled();
+  });
+
   test('stores token in localStorage on successful login', async () => {
     API.post.mockResolvedValueOnce({
       data: { access_token: 'my_secure_token', token_type: 'bearer' },
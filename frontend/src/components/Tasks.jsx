@@ -1,30 +1,80 @@
 
-import { useState, useEffect } from "react";
+import { useState, useEffect, useCallback, useMemo, useRef } from "react";
 import API from "../api";
+import * as client from "../dataClient";
 import TasksHeader from "./tasks/TasksHeader";
 import AddTaskForm from "./tasks/AddTaskForm";
-import TaskItem from "./tasks/TaskItem";
+import TaskList from "./tasks/TaskList";
+
+const PAGE_SIZE = 50;
+
+// Tasks are listed in id order, so a fetched page can be merged by id and
+// locally added tasks fall into place when their page arrives.
+const mergeTasks = (current, page) => {
+  const byId = new Map(current.map((t) => [t.id, t]));
+  page.forEach((t) => byId.set(t.id, t));
+  return Array.from(byId.values()).sort((a, b) => a.id - b.id);
+};
+
+// A refreshed first page replaces every loaded task it covers, so tasks
+// deleted elsewhere disappear as well.
+const replaceFirstPage = (current, page) => {
+  if (page.length < PAGE_SIZE) {
+    return page;
+  }
+  const lastId = page[page.length - 1].id;
+  return mergeTasks(current.filter((t) => t.id > lastId), page);
+};
+
+const replaceTask = (current, task) => current.map((t) => (t.id === task.id ? task : t));
+
+let nextOptimisticId = 1;
 
 function Tasks({ onLogout }) {
   const [tasks, setTasks] = useState([]);
+  const [addingTasks, setAddingTasks] = useState([]);
   const [newTaskTitle, setNewTaskTitle] = useState("");
   const [newTaskDescription, setNewTaskDescription] = useState("");
   const [loading, setLoading] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [hasMore, setHasMore] = useState(false);
   const [error, setError] = useState("");
   const [editingTask, setEditingTask] = useState(null);
+  const tasksRef = useRef(tasks);
+  const lastPagedId = useRef(0);
+  const pendingToggles = useRef(new Map());
+
+  tasksRef.current = tasks;
+
+  const trackPage = (page) => {
+    if (page.length > 0) {
+      lastPagedId.current = Math.max(lastPagedId.current, page[page.length - 1].id);
+    }
+    setHasMore(page.length === PAGE_SIZE);
+  };
+
+  const handleLoadError = (err) => {
+    if (err.response && err.response.status === 401) {
+      onLogout();
+    } else {
+      setError("Failed to load tasks");
+    }
+  };
 
   const loadTasks = async () => {
     try {
       setLoading(true);
       setError("");
-      const response = await API.get("/tasks");
-      setTasks(response.data);
+      lastPagedId.current = 0;
+      // A cached first page renders immediately; the fresh one replaces it
+      const page = await client.getCached("/tasks", { skip: 0, limit: PAGE_SIZE }, (freshPage) => {
+        trackPage(freshPage);
+        setTasks((current) => replaceFirstPage(current, freshPage));
+      });
+      trackPage(page);
+      setTasks(page);
     } catch (err) {
-      if (err.response && err.response.status === 401) {
-        onLogout();
-      } else {
-        setError("Failed to load tasks");
-      }
+      handleLoadError(err);
     } finally {
       setLoading(false);
     }
@@ -35,6 +85,25 @@ function Tasks({ onLogout }) {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []);
 
+  const loadMoreTasks = useCallback(async () => {
+    try {
+      setLoadingMore(true);
+      // Continue after the last fetched id, so deletions in loaded pages,
+      // here or on another device, cannot shift the next page
+      const page = await client.get("/tasks", { after_id: lastPagedId.current, limit: PAGE_SIZE });
+      trackPage(page);
+      setTasks((current) => mergeTasks(current, page));
+    } catch (err) {
+      setHasMore(false);
+      handleLoadError(err);
+    } finally {
+      setLoadingMore(false);
+    }
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [onLogout]);
+
+  // Add, toggle and delete update the list before the server answers and
+  // roll back on failure.
   const handleAddTask = async (e) => {
     e.preventDefault();
     if (!newTaskTitle.trim()) {
@@ -42,67 +111,133 @@ function Tasks({ onLogout }) {
       return;
     }
 
+    const title = newTaskTitle;
+    const description = newTaskDescription || null;
+    const optimisticTask = {
+      id: `optimistic-${nextOptimisticId++}`,
+      title,
+      description,
+      completed: false,
+      created_at: new Date().toISOString(),
+      optimistic: true,
+    };
+    setError("");
+    setAddingTasks((current) => [...current, optimisticTask]);
+    setNewTaskTitle("");
+    setNewTaskDescription("");
+
     try {
-      setError("");
-      const response = await API.post("/tasks", {
-        title: newTaskTitle,
-        description: newTaskDescription || null,
-      });
-      setTasks([...tasks, response.data]);
-      setNewTaskTitle("");
-      setNewTaskDescription("");
+      const created = await client.post("/tasks", { title, description });
+      setTasks((current) => [...current, created]);
     } catch (err) {
+      setNewTaskTitle((current) => current || title);
+      setNewTaskDescription((current) => current || description || "");
       setError("Failed to add task");
+    } finally {
+      setAddingTasks((current) => current.filter((t) => t.id !== optimisticTask.id));
     }
   };
 
-  const handleToggleComplete = async (task) => {
-    try {
-      const response = await API.put(`/tasks/${task.id}`, {
-        completed: !task.completed,
-      });
-      setTasks(tasks.map((t) => (t.id === task.id ? response.data : t)));
-    } catch (err) {
-      setError("Failed to update task");
+  // Handlers are stable and update state functionally so that memoized rows
+  // whose task did not change skip re-rendering.
+  //
+  // Each toggle replaces its task's entry in pendingToggles. A newer toggle
+  // cancels the pending one's request and retries and is sent once that has
+  // settled. Only the newest toggle's response or rollback is applied, so the
+  // user's last choice wins on the server and on screen.
+  const handleToggleComplete = useCallback((task) => {
+    if (task.optimistic) {
+      return;
     }
-  };
+    const previous = pendingToggles.current.get(task.id);
+    const toggle = {
+      controller: new AbortController(),
+      // A failure rolls back to the state before the first unconfirmed toggle
+      original: previous ? previous.original : task,
+    };
+    const isLatest = () => pendingToggles.current.get(task.id) === toggle;
+    pendingToggles.current.set(task.id, toggle);
+    setTasks((current) => replaceTask(current, { ...task, completed: !task.completed }));
 
-  const handleDeleteTask = async (taskId) => {
-    if (!window.confirm("Are you sure you want to delete this task?")) {
+    toggle.settled = (async () => {
+      if (previous) {
+        previous.controller.abort();
+        await previous.settled;
+      }
+      if (!isLatest()) {
+        return;
+      }
+      try {
+        const updated = await client.put(
+          `/tasks/${task.id}`,
+          { completed: !task.completed },
+          { signal: toggle.controller.signal }
+        );
+        if (isLatest()) {
+          setTasks((current) => replaceTask(current, updated));
+        }
+      } catch (err) {
+        if (isLatest()) {
+          setTasks((current) => replaceTask(current, toggle.original));
+          setError("Failed to update task");
+        }
+      } finally {
+        if (isLatest()) {
+          pendingToggles.current.delete(task.id);
+        }
+      }
+    })();
+    return toggle.settled;
+  }, []);
+
+  const handleDeleteTask = useCallback(async (taskId) => {
+    const task = tasksRef.current.find((t) => t.id === taskId);
+    if (!task || !window.confirm("Are you sure you want to delete this task?")) {
       return;
     }
 
+    setTasks((current) => current.filter((t) => t.id !== taskId));
     try {
-      await API.delete(`/tasks/${taskId}`);
-      setTasks(tasks.filter((t) => t.id !== taskId));
+      await client.remove(`/tasks/${taskId}`);
     } catch (err) {
+      setTasks((current) => mergeTasks(current, [task]));
       setError("Failed to delete task");
     }
-  };
+  }, []);
 
-  const handleStartEdit = (task) => {
-    setEditingTask({ ...task });
-  };
+  const handleStartEdit = useCallback((task) => {
+    if (!task.optimistic) {
+      setEditingTask({ ...task });
+    }
+  }, []);
 
-  const handleCancelEdit = () => {
+  const handleCancelEdit = useCallback(() => {
     setEditingTask(null);
-  };
+  }, []);
 
-  const handleSaveEdit = async () => {
+  const handleSaveEdit = useCallback(async (editedTask) => {
     try {
-      const response = await API.put(`/tasks/${editingTask.id}`, {
-        title: editingTask.title,
-        description: editingTask.description,
+      const updated = await client.put(`/tasks/${editedTask.id}`, {
+        title: editedTask.title,
+        description: editedTask.description,
       });
-      setTasks(tasks.map((t) => (t.id === editingTask.id ? response.data : t)));
+      setTasks((current) => replaceTask(current, updated));
       setEditingTask(null);
     } catch (err) {
       setError("Failed to update task");
     }
-  };
+  }, []);
+
+  const listedTasks = useMemo(
+    () => (addingTasks.length > 0 ? [...tasks, ...addingTasks] : tasks),
+    [tasks, addingTasks]
+  );
+
+  const pendingTasks = useMemo(() => listedTasks.filter((t) => !t.completed).length, [listedTasks]);
 
   const handleLogout = async () => {
     try {
+      // The refresh token to revoke is added by the API client
       await API.post("/logout");
     } catch (err) {
       console.error("Logout error:", err);
@@ -115,8 +250,9 @@ function Tasks({ onLogout }) {
     <div className="min-h-screen bg-gradient-to-br from-blue-50 to-indigo-100 py-8 px-4">
       <div className="max-w-4xl mx-auto">
         <TasksHeader 
-          totalTasks={tasks.length}
-          pendingTasks={tasks.filter((t) => !t.completed).length}
+          totalTasks={listedTasks.length}
+          pendingTasks={pendingTasks}
+          hasMore={hasMore}
           onLogout={handleLogout}
         />
 
@@ -136,27 +272,24 @@ function Tasks({ onLogout }) {
 
           {loading ? (
             <div className="text-center py-8 text-gray-600">Loading tasks...</div>
-          ) : tasks.length === 0 ? (
+          ) : listedTasks.length === 0 ? (
             <div className="text-center py-8 text-gray-500">
               No tasks yet. Create your first task above!
             </div>
           ) : (
-            <div className="space-y-4">
-              {tasks.map((task) => (
-                <TaskItem
-                  key={task.id}
-                  task={task}
-                  isEditing={editingTask && editingTask.id === task.id}
-                  editData={editingTask}
-                  onEdit={() => handleStartEdit(task)}
-                  onSave={handleSaveEdit}
-                  onCancel={handleCancelEdit}
-                  onToggle={() => handleToggleComplete(task)}
-                  onDelete={() => handleDeleteTask(task.id)}
-                  onEditChange={setEditingTask}
-                />
-              ))}
-            </div>
+            <TaskList
+              tasks={listedTasks}
+              editingTask={editingTask}
+              hasMore={hasMore}
+              loadingMore={loadingMore}
+              onLoadMore={loadMoreTasks}
+              onEdit={handleStartEdit}
+              onSave={handleSaveEdit}
+              onCancel={handleCancelEdit}
+              onToggle={handleToggleComplete}
+              onDelete={handleDeleteTask}
+              onEditChange={setEditingTask}
+            />
           )}
         </div>
       </div>
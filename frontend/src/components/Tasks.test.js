@@ -1,7 +1,9 @@
 import { render, screen, fireEvent, waitFor } from '@testing-library/react';
 import '@testing-library/jest-dom';
 import Tasks from './Tasks';
+import { ESTIMATED_ROW_HEIGHT } from './tasks/TaskList';
 import API from '../api';
+import { clearCache } from '../dataClient';
 
 jest.mock('../api');
 global.confirm = jest.fn();
@@ -9,11 +11,18 @@ global.confirm = jest.fn();
 describe('Tasks Component', () => {
   const mockOnLogout = jest.fn();
 
+  // Reset rather than clear so no unconsumed mock*Once leaks between tests.
+  // clearCache() also drops in-flight requests left by the previous test.
   beforeEach(() => {
-    jest.clearAllMocks();
+    jest.resetAllMocks();
+    clearCache();
     API.get.mockResolvedValue({ data: [] });
   });
 
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
   // ============================================
   // RENDERING TESTS
   // ============================================
@@ -265,7 +274,7 @@ describe('Tasks Component', () => {
     fireEvent.click(checkbox);
 
     await waitFor(() => {
-      expect(API.put).toHaveBeenCalledWith('/tasks/1', { completed: true });
+      expect(API.put).toHaveBeenCalledWith('/tasks/1', { completed: true }, { signal: expect.anything() });
     });
 
     await waitFor(() => {
@@ -297,7 +306,7 @@ describe('Tasks Component', () => {
     fireEvent.click(checkbox);
 
     await waitFor(() => {
-      expect(API.put).toHaveBeenCalledWith('/tasks/1', { completed: false });
+      expect(API.put).toHaveBeenCalledWith('/tasks/1', { completed: false }, { signal: expect.anything() });
     });
 
     await waitFor(() => {
@@ -653,4 +662,269 @@ describe('Tasks Component', () => {
     expect(screen.getByDisplayValue('Task 1')).toBeInTheDocument();
     expect(screen.queryByDisplayValue('Task 2')).not.toBeInTheDocument();
   });
+
+  // ============================================
+  // PERFORMANCE TESTS
+  // ============================================
+
+  const makeTasks = (count, startId = 1) =>
+    Array.from({ length: count }, (_, i) => ({
+      id: startId + i,
+      title: `Task ${startId + i}`,
+      description: `Description ${startId + i}`,
+      completed: false,
+      created_at: '2024-01-01T00:00:00',
+    }));
+
+  // Mirrors the backend: the first page by offset, later pages after an id
+  const pageOf = (allTasks, params) =>
+    params.after_id === undefined
+      ? allTasks.slice(params.skip, params.skip + params.limit)
+      : allTasks.filter((t) => t.id > params.after_id).slice(0, params.limit);
+
+  // jsdom does no layout. Rows measure 0 px high, so the list places every row
+  // at ESTIMATED_ROW_HEIGHT and scroll offsets can be computed from it.
+  // The height is pinned here rather than relying on jsdom's default.
+  const withoutLayout = () => {
+    jest.spyOn(HTMLElement.prototype, 'offsetHeight', 'get').mockReturnValue(0);
+  };
+
+  const scrollListTo = (list, scrollTop) => {
+    Object.defineProperty(list, 'scrollTop', { value: scrollTop, configurable: true });
+    fireEvent.scroll(list);
+  };
+
+  test('mounts only a window of rows for 10k tasks', async () => {
+    withoutLayout();
+    API.get.mockResolvedValueOnce({ data: makeTasks(10000) });
+
+    const { container } = render(<Tasks onLogout={mockOnLogout} />);
+
+    await waitFor(() => {
+      expect(screen.getByText('Task 1')).toBeInTheDocument();
+    });
+
+    expect(screen.getAllByRole('checkbox').length).toBeLessThanOrEqual(20);
+    expect(container.querySelectorAll('*').length).toBeLessThan(500);
+    expect(screen.queryByText('Task 10000')).not.toBeInTheDocument();
+
+    scrollListTo(screen.getByTestId('task-list'), ESTIMATED_ROW_HEIGHT * 9995);
+
+    await waitFor(() => {
+      expect(screen.getByText('Task 10000')).toBeInTheDocument();
+    });
+    expect(screen.queryByText('Task 1')).not.toBeInTheDocument();
+    expect(screen.getAllByRole('checkbox').length).toBeLessThanOrEqual(20);
+  });
+
+  test('loads the next page when scrolled to the end of the list', async () => {
+    withoutLayout();
+    const allTasks = makeTasks(120);
+    API.get.mockImplementation((url, { params }) =>
+      Promise.resolve({ data: pageOf(allTasks, params) })
+    );
+
+    render(<Tasks onLogout={mockOnLogout} />);
+
+    await waitFor(() => {
+      expect(screen.getByText('Task 1')).toBeInTheDocument();
+    });
+    expect(API.get).toHaveBeenCalledTimes(1);
+    expect(API.get).toHaveBeenCalledWith('/tasks', { params: { skip: 0, limit: 50 } });
+
+    scrollListTo(screen.getByTestId('task-list'), ESTIMATED_ROW_HEIGHT * 45);
+
+    await waitFor(() => {
+      expect(API.get).toHaveBeenCalledWith('/tasks', { params: { after_id: 50, limit: 50 } });
+    });
+    // More pages remain, so the header must not claim a total
+    await waitFor(() => {
+      expect(screen.getByText(/100\+ tasks, 100\+ pending/i)).toBeInTheDocument();
+    });
+    expect(screen.queryByText(/tasks total/i)).not.toBeInTheDocument();
+  });
+
+  test('header shows the total once the last page is loaded', async () => {
+    withoutLayout();
+    const allTasks = makeTasks(60);
+    API.get.mockImplementation((url, { params }) =>
+      Promise.resolve({ data: pageOf(allTasks, params) })
+    );
+
+    render(<Tasks onLogout={mockOnLogout} />);
+
+    await waitFor(() => {
+      expect(screen.getByText(/50\+ tasks, 50\+ pending/i)).toBeInTheDocument();
+    });
+
+    scrollListTo(screen.getByTestId('task-list'), ESTIMATED_ROW_HEIGHT * 45);
+
+    await waitFor(() => {
+      expect(screen.getByText(/60 tasks total, 60 pending/i)).toBeInTheDocument();
+    });
+  });
+
+  // ============================================
+  // NETWORK AND OPTIMISTIC UPDATE TESTS
+  // ============================================
+
+  test('remounting within the fresh window does not refetch tasks', async () => {
+    API.get.mockResolvedValue({ data: makeTasks(2) });
+
+    const { unmount } = render(<Tasks onLogout={mockOnLogout} />);
+    await waitFor(() => {
+      expect(screen.getByText('Task 1')).toBeInTheDocument();
+    });
+    unmount();
+
+    render(<Tasks onLogout={mockOnLogout} />);
+    await waitFor(() => {
+      expect(screen.getByText('Task 1')).toBeInTheDocument();
+    });
+
+    expect(API.get).toHaveBeenCalledTimes(1);
+  });
+
+  test('serves cached tasks after a mutation and revalidates once', async () => {
+    const mockTasks = makeTasks(2);
+    API.get.mockResolvedValueOnce({ data: mockTasks });
+    API.put.mockResolvedValueOnce({ data: { ...mockTasks[0], completed: true } });
+
+    const { unmount } = render(<Tasks onLogout={mockOnLogout} />);
+    await waitFor(() => {
+      expect(screen.getByText('Task 1')).toBeInTheDocument();
+    });
+    fireEvent.click(screen.getAllByRole('checkbox')[0]);
+    await waitFor(() => {
+      expect(API.put).toHaveBeenCalledTimes(1);
+    });
+    unmount();
+
+    let resolveRevalidation;
+    API.get.mockImplementationOnce(() => new Promise((resolve) => { resolveRevalidation = resolve; }));
+    render(<Tasks onLogout={mockOnLogout} />);
+
+    // The stale list shows while the revalidation is in flight
+    expect(await screen.findByText('Task 1')).toBeInTheDocument();
+    expect(API.get).toHaveBeenCalledTimes(2);
+
+    resolveRevalidation({ data: [mockTasks[1]] });
+    await waitFor(() => {
+      expect(screen.queryByText('Task 1')).not.toBeInTheDocument();
+    });
+    expect(screen.getByText('Task 2')).toBeInTheDocument();
+    expect(API.get).toHaveBeenCalledTimes(2);
+  });
+
+  test('shows a new task before the server responds', async () => {
+    let resolvePost;
+    API.post.mockImplementationOnce(() => new Promise((resolve) => { resolvePost = resolve; }));
+
+    render(<Tasks onLogout={mockOnLogout} />);
+    await waitFor(() => {
+      expect(screen.getByText('No tasks yet. Create your first task above!')).toBeInTheDocument();
+    });
+
+    fireEvent.change(screen.getByPlaceholderText('Task title'), { target: { value: 'Fast Task' } });
+    fireEvent.click(screen.getByText('Add Task'));
+
+    expect(screen.getByText('Fast Task')).toBeInTheDocument();
+
+    resolvePost({ data: { ...makeTasks(1)[0], title: 'Fast Task' } });
+    await waitFor(() => {
+      expect(screen.getAllByText('Fast Task')).toHaveLength(1);
+    });
+    expect(API.post).toHaveBeenCalledTimes(1);
+  });
+
+  test('rolls back an optimistic add when the server rejects it', async () => {
+    API.post.mockRejectedValueOnce({ response: { status: 500 } });
+
+    render(<Tasks onLogout={mockOnLogout} />);
+    await waitFor(() => {
+      expect(screen.getByPlaceholderText('Task title')).toBeInTheDocument();
+    });
+
+    fireEvent.change(screen.getByPlaceholderText('Task title'), { target: { value: 'Doomed Task' } });
+    fireEvent.click(screen.getByText('Add Task'));
+
+    await waitFor(() => {
+      expect(screen.getByText('Failed to add task')).toBeInTheDocument();
+    });
+    expect(screen.queryByText('Doomed Task')).not.toBeInTheDocument();
+    expect(screen.getByPlaceholderText('Task title').value).toBe('Doomed Task');
+    // POST is never retried, so a failure cannot create duplicates
+    expect(API.post).toHaveBeenCalledTimes(1);
+  });
+
+  test('toggles a task before the server responds and rolls back on failure', async () => {
+    let rejectPut;
+    API.get.mockResolvedValueOnce({ data: makeTasks(1) });
+    API.put.mockImplementationOnce(() => new Promise((resolve, reject) => { rejectPut = reject; }));
+
+    render(<Tasks onLogout={mockOnLogout} />);
+    await waitFor(() => {
+      expect(screen.getByText('Task 1')).toBeInTheDocument();
+    });
+
+    fireEvent.click(screen.getByRole('checkbox'));
+    expect(screen.getByRole('checkbox')).toBeChecked();
+
+    rejectPut({ response: { status: 400 } });
+    await waitFor(() => {
+      expect(screen.getByRole('checkbox')).not.toBeChecked();
+    });
+    expect(screen.getByText('Failed to update task')).toBeInTheDocument();
+  });
+
+  test('a second toggle replaces a pending one and wins', async () => {
+    let resolveFirst;
+    const [task] = makeTasks(1);
+    API.get.mockResolvedValueOnce({ data: [task] });
+    API.put
+      .mockImplementationOnce(() => new Promise((resolve) => { resolveFirst = resolve; }))
+      .mockResolvedValueOnce({ data: { ...task, completed: false } });
+
+    render(<Tasks onLogout={mockOnLogout} />);
+    await waitFor(() => {
+      expect(screen.getByText('Task 1')).toBeInTheDocument();
+    });
+
+    fireEvent.click(screen.getByRole('checkbox'));
+    fireEvent.click(screen.getByRole('checkbox'));
+    expect(screen.getByRole('checkbox')).not.toBeChecked();
+
+    // The first request is cancelled; its late response must not be applied
+    expect(API.put.mock.calls[0][2].signal.aborted).toBe(true);
+    resolveFirst({ data: { ...task, completed: true } });
+
+    await waitFor(() => {
+      expect(API.put).toHaveBeenCalledTimes(2);
+    });
+    expect(API.put).toHaveBeenLastCalledWith('/tasks/1', { completed: false }, { signal: expect.anything() });
+    await waitFor(() => {
+      expect(screen.getByRole('checkbox')).not.toBeChecked();
+    });
+    expect(screen.queryByText('Failed to update task')).not.toBeInTheDocument();
+  });
+
+  test('restores a deleted task when the server rejects the delete', async () => {
+    API.get.mockResolvedValueOnce({ data: makeTasks(2) });
+    API.delete.mockRejectedValueOnce({ response: { status: 404 } });
+    global.confirm.mockReturnValueOnce(true);
+
+    render(<Tasks onLogout={mockOnLogout} />);
+    await waitFor(() => {
+      expect(screen.getByText('Task 1')).toBeInTheDocument();
+    });
+
+    fireEvent.click(screen.getAllByText('Delete')[0]);
+    expect(screen.queryByText('Task 1')).not.toBeInTheDocument();
+
+    await waitFor(() => {
+      expect(screen.getByText('Failed to delete task')).toBeInTheDocument();
+    });
+    expect(screen.getByText('Task 1')).toBeInTheDocument();
+    expect(API.delete).toHaveBeenCalledTimes(1);
+  });
 });
\ No newline at end of file
@@ -31,7 +31,7 @@ function TaskItem({
           />
           <div className="flex gap-2">
             <button
-              onClick={onSave}
+              onClick={() => onSave(editData)}
               className="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition"
             >
               Save
@@ -57,7 +57,7 @@ function TaskItem({
           <input
             type="checkbox"
             checked={task.completed}
-            onChange={onToggle}
+            onChange={() => onToggle(task)}
             className="mt-1 w-5 h-5 text-blue-600 rounded focus:ring-2 focus:ring-blue-500 cursor-pointer"
           />
           <div className="flex-1">
@@ -78,13 +78,13 @@ function TaskItem({
         </div>
         <div className="flex gap-2 ml-4">
           <button
-            onClick={onEdit}
+            onClick={() => onEdit(task)}
             className="px-3 py-1 text-sm bg-yellow-500 text-white rounded hover:bg-yellow-600 transition"
           >
             Edit
           </button>
           <button
-            onClick={onDelete}
+            onClick={() => onDelete(task.id)}
             className="px-3 py-1 text-sm bg-red-500 text-white rounded hover:bg-red-600 transition"
           >
             Delete
@@ -95,4 +95,5 @@ function TaskItem({
   );
 }
 
-export default TaskItem;
\ No newline at end of file
+// Rows only re-render when their own task or edit state changes
+export default React.memo(TaskItem);
\ No newline at end of file
@@ -0,0 +1,111 @@
+import React, { useCallback, useEffect, useMemo, useRef, useState } from 'react';
+import TaskItem from './TaskItem';
+
+export const ESTIMATED_ROW_HEIGHT = 128;
+const OVERSCAN = 5;
+
+// Renders only the rows inside the scroll viewport (plus a few either side).
+// Row heights are measured after mount and cached by task id; unmeasured rows
+// use an estimate, so offsets stay stable as the user scrolls.
+function TaskList({
+  tasks,
+  height = 640,
+  editingTask,
+  hasMore,
+  loadingMore,
+  onLoadMore,
+  onEdit,
+  onSave,
+  onCancel,
+  onToggle,
+  onDelete,
+  onEditChange
+}) {
+  const [scrollTop, setScrollTop] = useState(0);
+  const [measuredVersion, setMeasuredVersion] = useState(0);
+  const rowHeights = useRef(new Map());
+
+  const offsets = useMemo(() => {
+    const result = new Array(tasks.length + 1);
+    result[0] = 0;
+    for (let i = 0; i < tasks.length; i++) {
+      result[i + 1] = result[i] + (rowHeights.current.get(tasks[i].id) || ESTIMATED_ROW_HEIGHT);
+    }
+    return result;
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [tasks, measuredVersion]);
+
+  // Index of the row containing the given vertical offset
+  const rowAt = (offset) => {
+    let low = 0;
+    let high = tasks.length;
+    while (low < high) {
+      const mid = (low + high) >> 1;
+      if (offsets[mid + 1] <= offset) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    return low;
+  };
+
+  const start = Math.max(0, rowAt(scrollTop) - OVERSCAN);
+  const end = Math.min(tasks.length, rowAt(scrollTop + height) + 1 + OVERSCAN);
+
+  const measureRow = useCallback((id, node) => {
+    if (!node) {
+      return;
+    }
+    const measured = node.offsetHeight;
+    if (measured > 0 && rowHeights.current.get(id) !== measured) {
+      rowHeights.current.set(id, measured);
+      setMeasuredVersion((version) => version + 1);
+    }
+  }, []);
+
+  useEffect(() => {
+    if (hasMore && !loadingMore && end >= tasks.length - OVERSCAN) {
+      onLoadMore();
+    }
+  }, [end, tasks.length, hasMore, loadingMore, onLoadMore]);
+
+  const visibleTasks = tasks.slice(start, end);
+
+  return (
+    <div
+      className="overflow-y-auto"
+      style={{ maxHeight: height }}
+      onScroll={(e) => setScrollTop(e.currentTarget.scrollTop)}
+      data-testid="task-list"
+    >
+      <div style={{ height: offsets[tasks.length], position: "relative" }}>
+        <div style={{ position: "absolute", top: offsets[start], left: 0, right: 0 }}>
+          {visibleTasks.map((task) => {
+            const isEditing = Boolean(editingTask && editingTask.id === task.id);
+            return (
+              <div key={task.id} ref={(node) => measureRow(task.id, node)} className="pb-4">
+                <TaskItem
+                  task={task}
+                  isEditing={isEditing}
+                  editData={isEditing ? editingTask : null}
+                  onEdit={onEdit}
+                  onSave={onSave}
+                  onCancel={onCancel}
+                  onToggle={onToggle}
+                  onDelete={onDelete}
+                  onEditChange={onEditChange}
+                />
+              </div>
+            );
+          })}
+        </div>
+      </div>
+      {loadingMore && (
+        <div className="text-center py-4 text-gray-600">Loading more tasks...</div>
+      )}
+    </div>
+  );
+}
+
+export default TaskList;
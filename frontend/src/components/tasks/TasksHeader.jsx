@@ -1,15 +1,23 @@
 import React from 'react';
 
-function TasksHeader({ totalTasks, pendingTasks, onLogout }) {
+// While more pages remain the counts only cover the loaded tasks, so they
+// are shown as lower bounds rather than as a total.
+function TasksHeader({ totalTasks, pendingTasks, hasMore, onLogout }) {
   return (
     <div className="bg-white rounded-2xl shadow-xl p-6 mb-6">
       <div className="flex justify-between items-center">
         <div>
           <h1 className="text-3xl font-bold text-gray-800">My Tasks</h1>
-          <p className="text-gray-600 mt-1">
-            {totalTasks} {totalTasks === 1 ? "task" : "tasks"} total,{" "}
-            {pendingTasks} pending
-          </p>
+          {hasMore ? (
+            <p className="text-gray-600 mt-1">
+              {totalTasks}+ tasks, {pendingTasks}+ pending
+            </p>
+          ) : (
+            <p className="text-gray-600 mt-1">
+              {totalTasks} {totalTasks === 1 ? "task" : "tasks"} total,{" "}
+              {pendingTasks} pending
+            </p>
+          )}
         </div>
         <button
           onClick={onLogout}
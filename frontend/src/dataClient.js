@@ -0,0 +1,142 @@
+import API from "./api";
+
+// Backoff before each retry of a transient failure; jittered by +/-50%.
+export const RETRY_DELAYS_MS = [300, 1000, 3000];
+
+// A cached response younger than this is served without revalidating.
+export const FRESH_FOR_MS = 5000;
+
+const inFlight = new Map();
+const cache = new Map();
+
+// Bumped by clearCache() so responses to requests sent before it, such as a
+// previous user's, are not cached afterwards.
+let generation = 0;
+
+const cacheKey = (url, params) =>
+  params ? `${url}?${new URLSearchParams(params).toString()}` : url;
+
+// Resolves after ms, or as soon as the signal aborts.
+const sleep = (ms, signal) =>
+  new Promise((resolve) => {
+    const timer = setTimeout(resolve, ms);
+    if (signal) {
+      signal.addEventListener("abort", () => {
+        clearTimeout(timer);
+        resolve();
+      }, { once: true });
+    }
+  });
+
+// Network errors, timeouts, rate limiting and server errors are worth
+// retrying; anything else (validation, auth, not found) will fail again.
+export const isTransientError = (err) => {
+  if (!err || (!err.request && !err.response)) {
+    return false;
+  }
+  if (!err.response) {
+    return true;
+  }
+  const status = err.response.status;
+  return status === 408 || status === 429 || status >= 500;
+};
+
+// An aborted signal stops the retries; the last error is thrown.
+export const withRetry = async (request, delays = RETRY_DELAYS_MS, signal) => {
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await request();
+    } catch (err) {
+      if (attempt >= delays.length || !isTransientError(err) || (signal && signal.aborted)) {
+        throw err;
+      }
+      await sleep(delays[attempt] * (0.5 + Math.random()), signal);
+      if (signal && signal.aborted) {
+        throw err;
+      }
+    }
+  }
+};
+
+// Concurrent identical GETs share a single request. Only responses requested
+// through getCached() are kept, so pages read once do not pile up in memory.
+const fetchShared = (url, params, store) => {
+  const key = cacheKey(url, params);
+  let entry = inFlight.get(key);
+  if (!entry) {
+    const requestGeneration = generation;
+    entry = { store };
+    entry.promise = withRetry(() => (params ? API.get(url, { params }) : API.get(url)))
+      .then((response) => {
+        if (entry.store && requestGeneration === generation) {
+          cache.set(key, { data: response.data, fetchedAt: Date.now() });
+        }
+        return response.data;
+      })
+      .finally(() => {
+        if (requestGeneration === generation) {
+          inFlight.delete(key);
+        }
+      });
+    inFlight.set(key, entry);
+  }
+  // A cached read joining an uncached one still wants the response kept
+  entry.store = entry.store || store;
+  return entry.promise;
+};
+
+// Resolves to the response data without caching it.
+export const get = (url, params) => fetchShared(url, params, false);
+
+// Stale-while-revalidate: a cached response is returned immediately and, if it
+// is no longer fresh, refetched in the background with the result passed to
+// onRevalidate. Without a cached response this fetches and caches it.
+export const getCached = (url, params, onRevalidate) => {
+  const entry = cache.get(cacheKey(url, params));
+  if (!entry) {
+    return fetchShared(url, params, true);
+  }
+  if (Date.now() - entry.fetchedAt >= FRESH_FOR_MS) {
+    fetchShared(url, params, true)
+      .then((data) => onRevalidate && onRevalidate(data))
+      .catch(() => {});
+  }
+  return Promise.resolve(entry.data);
+};
+
+// Mark every cached response under a URL as stale so the next read revalidates.
+export const invalidate = (url) => {
+  cache.forEach((entry, key) => {
+    if (key === url || key.startsWith(`${url}?`)) {
+      entry.fetchedAt = 0;
+    }
+  });
+};
+
+export const clearCache = () => {
+  generation += 1;
+  cache.clear();
+  inFlight.clear();
+};
+
+// PUT and DELETE are idempotent and retried; POST is sent once so a retry
+// cannot create a duplicate.
+export const post = async (url, data) => {
+  const response = await API.post(url, data);
+  invalidate(url);
+  return response.data;
+};
+
+// Pass { signal } to cancel the request and any retries still to come.
+export const put = async (url, data, config) => {
+  const signal = config && config.signal;
+  const response = await withRetry(() => (config ? API.put(url, data, config) : API.put(url, data)), RETRY_DELAYS_MS, signal);
+  invalidate(url.slice(0, url.lastIndexOf("/")));
+  return response.data;
+};
+
+export const remove = async (url) => {
+  const response = await withRetry(() => API.delete(url));
+  invalidate(url.slice(0, url.lastIndexOf("/")));
+  return response.data;
+};
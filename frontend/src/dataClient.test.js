@@ -0,0 +1,190 @@
+import API from './api';
+import * as client from './dataClient';
+
+jest.mock('./api');
+
+describe('dataClient', () => {
+  // Reset rather than clear: an unconsumed mock*Once from one test must not
+  // leak into the next, whatever Jest's resetMocks setting is.
+  beforeEach(() => {
+    jest.resetAllMocks();
+    jest.restoreAllMocks();
+    client.clearCache();
+    API.get.mockResolvedValue({ data: [] });
+  });
+
+  // ============================================
+  // DEDUPLICATION TESTS
+  // ============================================
+
+  test('concurrent identical GETs send one request', async () => {
+    API.get.mockResolvedValueOnce({ data: ['a'] });
+
+    const results = await Promise.all([
+      client.get('/tasks', { skip: 0, limit: 50 }),
+      client.get('/tasks', { skip: 0, limit: 50 }),
+      client.get('/tasks', { skip: 0, limit: 50 }),
+    ]);
+
+    expect(API.get).toHaveBeenCalledTimes(1);
+    expect(API.get).toHaveBeenCalledWith('/tasks', { params: { skip: 0, limit: 50 } });
+    expect(results).toEqual([['a'], ['a'], ['a']]);
+  });
+
+  test('GETs with different params are not merged', async () => {
+    await Promise.all([
+      client.get('/tasks', { skip: 0, limit: 50 }),
+      client.get('/tasks', { skip: 50, limit: 50 }),
+    ]);
+
+    expect(API.get).toHaveBeenCalledTimes(2);
+  });
+
+  test('a finished request is not reused by get()', async () => {
+    await client.get('/tasks');
+    await client.get('/tasks');
+
+    expect(API.get).toHaveBeenCalledTimes(2);
+  });
+
+  // ============================================
+  // STALE-WHILE-REVALIDATE TESTS
+  // ============================================
+
+  test('fresh cached responses are served without a request', async () => {
+    API.get.mockResolvedValueOnce({ data: ['a'] });
+
+    await client.getCached('/tasks');
+    const data = await client.getCached('/tasks');
+
+    expect(data).toEqual(['a']);
+    expect(API.get).toHaveBeenCalledTimes(1);
+  });
+
+  test('stale cached responses are served and revalidated in the background', async () => {
+    const now = Date.now();
+    jest.spyOn(Date, 'now').mockReturnValue(now);
+    API.get.mockResolvedValueOnce({ data: ['old'] });
+    await client.getCached('/tasks');
+
+    Date.now.mockReturnValue(now + client.FRESH_FOR_MS);
+    API.get.mockResolvedValueOnce({ data: ['new'] });
+    const onRevalidate = jest.fn();
+    const data = await client.getCached('/tasks', undefined, onRevalidate);
+
+    expect(data).toEqual(['old']);
+    await new Promise((resolve) => setTimeout(resolve, 0));
+    expect(onRevalidate).toHaveBeenCalledWith(['new']);
+    expect(API.get).toHaveBeenCalledTimes(2);
+  });
+
+  test('get() does not cache responses', async () => {
+    await client.get('/tasks', { after_id: 50, limit: 50 });
+    await client.getCached('/tasks', { after_id: 50, limit: 50 });
+
+    expect(API.get).toHaveBeenCalledTimes(2);
+  });
+
+  test('a cached read joining an uncached one keeps the response', async () => {
+    API.get.mockResolvedValueOnce({ data: ['a'] });
+
+    await Promise.all([client.get('/tasks'), client.getCached('/tasks')]);
+    const data = await client.getCached('/tasks');
+
+    expect(data).toEqual(['a']);
+    expect(API.get).toHaveBeenCalledTimes(1);
+  });
+
+  test('mutations mark cached task pages as stale', async () => {
+    await client.getCached('/tasks', { skip: 0, limit: 50 });
+    API.put.mockResolvedValueOnce({ data: { id: 1 } });
+    await client.put('/tasks/1', { completed: true });
+
+    await client.getCached('/tasks', { skip: 0, limit: 50 }, jest.fn());
+
+    expect(API.get).toHaveBeenCalledTimes(2);
+  });
+
+  test('a request pending across clearCache() is not cached', async () => {
+    let resolveOld;
+    API.get.mockReturnValueOnce(new Promise((resolve) => { resolveOld = resolve; }));
+    const oldRequest = client.getCached('/tasks');
+
+    // Log out and log in as someone else while the first request is pending
+    client.clearCache();
+    API.get.mockResolvedValueOnce({ data: ['new user'] });
+    await client.getCached('/tasks');
+
+    resolveOld({ data: ['old user'] });
+    await oldRequest;
+
+    await expect(client.getCached('/tasks')).resolves.toEqual(['new user']);
+    expect(API.get).toHaveBeenCalledTimes(2);
+  });
+
+  test('a request pending across clearCache() does not end newer deduplication', async () => {
+    let resolveOld;
+    let resolveNew;
+    API.get
+      .mockReturnValueOnce(new Promise((resolve) => { resolveOld = resolve; }))
+      .mockReturnValueOnce(new Promise((resolve) => { resolveNew = resolve; }));
+    const oldRequest = client.get('/tasks');
+
+    client.clearCache();
+    const newRequest = client.get('/tasks');
+    resolveOld({ data: ['old user'] });
+    await oldRequest;
+
+    expect(client.get('/tasks')).toBe(newRequest);
+    resolveNew({ data: ['new user'] });
+    await expect(newRequest).resolves.toEqual(['new user']);
+    expect(API.get).toHaveBeenCalledTimes(2);
+  });
+
+  // ============================================
+  // RETRY TESTS
+  // ============================================
+
+  test('retries transient errors until one succeeds', async () => {
+    const request = jest.fn()
+      .mockRejectedValueOnce({ request: {} })
+      .mockRejectedValueOnce({ request: {}, response: { status: 503 } })
+      .mockResolvedValueOnce('ok');
+
+    await expect(client.withRetry(request, [1, 1, 1])).resolves.toBe('ok');
+    expect(request).toHaveBeenCalledTimes(3);
+  });
+
+  test('gives up after the last backoff delay', async () => {
+    const request = jest.fn().mockRejectedValue({ request: {}, response: { status: 502 } });
+
+    await expect(client.withRetry(request, [1, 1])).rejects.toEqual({ request: {}, response: { status: 502 } });
+    expect(request).toHaveBeenCalledTimes(3);
+  });
+
+  test('does not retry client errors', async () => {
+    const request = jest.fn().mockRejectedValue({ request: {}, response: { status: 401 } });
+
+    await expect(client.withRetry(request, [1, 1])).rejects.toBeTruthy();
+    expect(request).toHaveBeenCalledTimes(1);
+  });
+
+  test('stops retrying once the signal is aborted', async () => {
+    const controller = new AbortController();
+    const request = jest.fn().mockRejectedValue({ request: {} });
+
+    const result = client.withRetry(request, [60000], controller.signal);
+    await Promise.resolve();
+    controller.abort();
+
+    await expect(result).rejects.toEqual({ request: {} });
+    expect(request).toHaveBeenCalledTimes(1);
+  });
+
+  test('does not retry POST', async () => {
+    API.post.mockRejectedValueOnce({ request: {} });
+
+    await expect(client.post('/tasks', { title: 'Task' })).rejects.toBeTruthy();
+    expect(API.post).toHaveBeenCalledTimes(1);
+  });
+});